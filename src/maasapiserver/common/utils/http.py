@@ -10,11 +10,10 @@ class _IPValidator(BaseModel):
 
 
 def extract_absolute_uri(request: Request) -> str:
-    if (
-        "x-forwarded-host" in request.headers
-        and "x-forwarded-proto" in request.headers
-    ):
-        return f"{request.headers.get('x-forwarded-proto')}://{request.headers.get('x-forwarded-host')}/"
+    proto = request.headers.get("x-forwarded-proto")
+    host = request.headers.get("x-forwarded-host")
+    if proto and host:
+        return f"{proto}://{host}/"
     return str(request.base_url)
 
 
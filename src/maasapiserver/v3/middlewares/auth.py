@@ -63,6 +63,10 @@ from maasservicelayer.utils.date import utcnow
 
 EXTERNAL_USER_CHECK_INTERVAL = timedelta(hours=1)
 
+# Shared immutable role sets so providers do not rebuild them per request.
+_USER_ROLES = frozenset({UserRole.USER})
+_ADMIN_ROLES = frozenset({UserRole.ADMIN, UserRole.USER})
+
 logger = structlog.getLogger()
 
 
@@ -94,11 +98,7 @@ class DjangoSessionAuthenticationProvider(AuthenticationProvider):
         return AuthenticatedUser(
             id=user.id,
             username=user.username,
-            roles=(
-                {UserRole.ADMIN, UserRole.USER}
-                if user.is_superuser
-                else {UserRole.USER}
-            ),
+            roles=_ADMIN_ROLES if user.is_superuser else _USER_ROLES,
         )
 
 
@@ -190,11 +190,7 @@ class MacaroonAuthenticationProvider:
         return AuthenticatedUser(
             id=user.id,
             username=user.username,
-            roles=(
-                {UserRole.ADMIN, UserRole.USER}
-                if user.is_superuser
-                else {UserRole.USER}
-            ),
+            roles=_ADMIN_ROLES if user.is_superuser else _USER_ROLES,
         )
 
     async def _raise_discharge_exception(self, request, caveats, ops):
@@ -402,11 +398,7 @@ class OIDCAuthenticationProvider(AuthenticationProvider):
         return AuthenticatedUser(
             id=user.id,
             username=user.username,
-            roles=(
-                {UserRole.ADMIN, UserRole.USER}
-                if user.is_superuser
-                else {UserRole.USER}
-            ),
+            roles=_ADMIN_ROLES if user.is_superuser else _USER_ROLES,
         )
 
     async def _is_token_valid(self, request: Request, token: str) -> bool:
@@ -555,7 +547,9 @@ class V3AuthenticationMiddleware(BaseHTTPMiddleware):
     async def _jwt_authentication(
         self, request: Request, auth_header: str
     ) -> AuthenticatedUser:
-        token = auth_header.split(" ")[1]
+        # dispatch() only routes here when the header starts with "bearer ",
+        # so slice the prefix off instead of splitting into a throwaway list.
+        token = auth_header[len("bearer ") :]
         try:
             header = jwt.get_unverified_claims(token)
         except JWTError:
@@ -29,6 +29,17 @@ class RegistryType(type):
             raise KeyError(f"Key '{name}' is already present in the registry")
         _registry[cls][name] = item
 
+    def register_items(cls, items):
+        """Register a mapping of name to item in a single update."""
+        registry = _registry[cls]
+        duplicates = registry.keys() & items.keys()
+        if duplicates:
+            raise KeyError(
+                "Keys %s are already present in the registry"
+                % ", ".join(repr(name) for name in sorted(duplicates))
+            )
+        registry.update(items)
+
     def unregister_item(cls, name):
         _registry[cls].pop(name, None)
 
@@ -39,6 +39,12 @@ class ACTIONS:
     DELETE = "delete"
 
 
+# `map_enum` builds a fresh dict on every call; the possible actions are
+# fixed at import, so compute the forms the hot paths need once.
+_ACTION_VALUES = tuple(sorted(map_enum(ACTIONS).values()))
+_ACTIONS_SET = frozenset(_ACTION_VALUES)
+
+
 class PostgresListenerNotifyError(Exception):
     """Error raised when the listener gets a notify message that cannot be
     decoded or is not being handled."""
@@ -77,6 +83,11 @@ class PostgresListenerService(Service):
     HANDLE_NOTIFY_DELAY = 0.5
     CHANNEL_REGISTRAR_DELAY = 0.5
 
+    # Base delay (seconds) before the first reconnection attempt, and
+    # the upper bound the exponential backoff is capped at.
+    RECONNECT_BASE_DELAY = 3
+    RECONNECT_MAX_DELAY = 60
+
     def __init__(self, alias="default"):
         self.alias = alias
         self.listeners = defaultdict(list)
@@ -84,8 +95,13 @@ class PostgresListenerService(Service):
         self.connection = None
         self.connectionFileno = None
         self.notifications = deque()
+        # Mirror of `notifications` for O(1) duplicate checks; a deque
+        # membership test is a linear scan and doRead can face thousands
+        # of pending notifications under write storms.
+        self._queued_notifications = set()
         self.notifier = task.LoopingCall(self.handleNotifies)
         self.notifierDone = None
+        self.notifierWake = None
         self.connecting = None
         self.disconnecting = None
         self.shutting_down = False
@@ -96,9 +112,11 @@ class PostgresListenerService(Service):
         self.channelRegistrarDone = None
         self.log = Logger(__name__, self)
         self.events = EventGroup("connected", "disconnected")
+        self._connectionAttempts = 0
         # the connection object isn't threadsafe, so we need to lock in order
         # to use it in different threads
         self._db_lock = threading.RLock()
+        self._channelConvertCache = {}
 
     def startService(self):
         """Start the listener."""
@@ -235,7 +253,16 @@ class PostgresListenerService(Service):
     @synchronous
     def createConnection(self):
         """Create new database connection."""
-        db = connections.databases[self.alias]
+        db = dict(connections.databases[self.alias])
+        # Enable TCP keepalives so that an idle LISTEN connection severed
+        # by a firewall or NAT idle timeout is noticed and reconnected,
+        # instead of silently never receiving another notification.
+        options = dict(db.get("OPTIONS") or {})
+        options.setdefault("keepalives", 1)
+        options.setdefault("keepalives_idle", 30)
+        options.setdefault("keepalives_interval", 10)
+        options.setdefault("keepalives_count", 5)
+        db["OPTIONS"] = options
         backend = load_backend(db["ENGINE"])
         return backend.DatabaseWrapper(db, self.alias)
 
@@ -270,6 +297,7 @@ class PostgresListenerService(Service):
                 )
 
             def cb_connect(_):
+                self._connectionAttempts = 0
                 self.log.info("Listening for database notifications.")
 
             def eb_connect(failure):
@@ -280,7 +308,7 @@ class PostgresListenerService(Service):
                 if failure.check(CancelledError):
                     return failure
                 elif self.autoReconnect:
-                    return deferLater(reactor, 3, connect)
+                    return deferLater(reactor, self._nextBackoff(), connect)
                 else:
                     return failure
 
@@ -341,9 +369,23 @@ class PostgresListenerService(Service):
         else:
             self.log.failure("Connection lost.", reason)
         if self.autoReconnect:
-            reactor.callLater(3, self.tryConnection)
+            reactor.callLater(self._nextBackoff(), self.tryConnection)
         self.events.disconnected.fire(reason)
 
+    def _nextBackoff(self):
+        """Return the delay before the next reconnection attempt.
+
+        The delay doubles with every consecutive failure, starting at
+        `RECONNECT_BASE_DELAY` seconds and capped at `RECONNECT_MAX_DELAY`
+        seconds. It resets once a connection is established.
+        """
+        delay = min(
+            self.RECONNECT_MAX_DELAY,
+            self.RECONNECT_BASE_DELAY * 2**self._connectionAttempts,
+        )
+        self._connectionAttempts += 1
+        return delay
+
     def registerChannel(self, channel):
         """Register the channel."""
         self.log.debug(f"Register Channel {channel}")
@@ -353,7 +395,7 @@ class PostgresListenerService(Service):
                 cursor.execute("LISTEN %s;" % channel)
             else:
                 # Not a system channel so listen called once for each action.
-                for action in sorted(map_enum(ACTIONS).values()):
+                for action in _ACTION_VALUES:
                     cursor.execute(f"LISTEN {channel}_{action};")
 
     def unregisterChannel(self, channel):
@@ -365,7 +407,7 @@ class PostgresListenerService(Service):
                 cursor.execute("UNLISTEN %s;" % channel)
             else:
                 # Not a system channel so unlisten called once for each action.
-                for action in sorted(map_enum(ACTIONS).values()):
+                for action in _ACTION_VALUES:
                     cursor.execute(f"UNLISTEN {channel}_{action};")
 
     async def registerChannels(self):
@@ -414,16 +456,24 @@ class PostgresListenerService(Service):
         :raise PostgresListenerNotifyError: When {channel} is not registered or
             {action} is not in `ACTIONS`.
         """
-        channel, action = channel.split("_", 1)
-        if channel not in self.listeners:
-            raise PostgresListenerNotifyError(
-                "%s is not a registered channel." % channel
-            )
-        if action not in map_enum(ACTIONS).values():
+        converted = self._channelConvertCache.get(channel)
+        if converted is None:
+            base_channel, action = channel.split("_", 1)
+            if action not in _ACTIONS_SET:
+                raise PostgresListenerNotifyError(
+                    "%s action is not supported." % action
+                )
+            converted = (base_channel, action)
+            # Postgres only delivers notifications for channels this
+            # service LISTENs to, so the cache stays bounded.
+            self._channelConvertCache[channel] = converted
+        # Registrations change at runtime; the membership check cannot be
+        # cached along with the parse.
+        if converted[0] not in self.listeners:
             raise PostgresListenerNotifyError(
-                "%s action is not supported." % action
+                "%s is not a registered channel." % converted[0]
             )
-        return channel, action
+        return converted
 
     def runChannelRegistrar(self):
         """Start the loop for listening to channels in postgres.
@@ -450,18 +500,38 @@ class PostgresListenerService(Service):
 
     def cancelHandleNotify(self):
         """Cancel the deferred `handleNotify` call."""
+        if self.notifierWake is not None and self.notifierWake.active():
+            self.notifierWake.cancel()
+        self.notifierWake = None
         if self.notifier.running:
             self.notifier.stop()
             return self.notifierDone
         else:
             return succeed(None)
 
+    def wakeHandleNotify(self):
+        """Process queued notifications on the next reactor iteration.
+
+        The notifier `LoopingCall` keeps running at `HANDLE_NOTIFY_DELAY`
+        as a bounded safety net, but new notifications should not have to
+        wait for the poll interval to elapse before being dispatched.
+        """
+
+        def wake():
+            self.notifierWake = None
+            return self.handleNotifies()
+
+        if self.notifier.running and self.notifierWake is None:
+            self.notifierWake = reactor.callLater(0, wake)
+
     def handleNotifies(self, clock=reactor):
         """Process all notify message in the notifications set."""
 
         def gen_notifications(notifications):
             while notifications:
-                yield notifications.popleft()
+                notification = notifications.popleft()
+                self._queued_notifications.discard(notification)
+                yield notification
 
         return task.coiterate(
             self.handleNotify(notification, clock=clock)
@@ -530,11 +600,15 @@ class PostgresListenerService(Service):
                 # Place non-system messages into the queue to be
                 # processed.
                 notification = (notify.channel, notify.payload)
-                if notification not in self.notifications:
+                if notification not in self._queued_notifications:
+                    self._queued_notifications.add(notification)
                     self.notifications.append(notification)
         # Delete the contents of the connection's notifies list so
         # that we don't process them a second time.
         del notifies[:]
+        if self.notifications:
+            # Wake the notifier instead of waiting for its poll interval.
+            self.wakeHandleNotify()
 
     @contextmanager
     def listen(self, channel, handler):
@@ -123,7 +123,9 @@ class TestPostgresListenerService(MAASServerTestCase):
         # call the handler directly in `doRead`.
         listener.notifications = frozenset()
         dv = DeferredValue()
-        listener.register("sys_test", lambda *args: dv.set(args))
+        listener.register(
+            "sys_test", lambda channel, payload: dv.set((channel, payload))
+        )
         yield listener.startService()
         try:
             yield deferToDatabase(self.send_notification, "sys_test", 1)
@@ -198,7 +200,9 @@ class TestPostgresListenerService(MAASServerTestCase):
         listener = PostgresListenerService()
         listener.HANDLE_NOTIFY_DELAY = listener.CHANNEL_REGISTRAR_DELAY = 0
         dv = DeferredValue()
-        listener.register("machine", lambda *args: dv.set(args))
+        listener.register(
+            "machine", lambda action, obj_id: dv.set((action, obj_id))
+        )
         yield listener.startService()
         yield listener.channelRegistrarDone
         try:
@@ -218,7 +222,9 @@ class TestPostgresListenerService(MAASServerTestCase):
         try:
             # Register after the service has been started. The handler should
             # still be called.
-            listener.register("machine", lambda *args: dv.set(args))
+            listener.register(
+                "machine", lambda action, obj_id: dv.set((action, obj_id))
+            )
             yield listener.channelRegistrarDone
             yield deferToDatabase(self.send_notification, "machine_create", 1)
             yield dv.get(timeout=2)
@@ -281,6 +287,15 @@ class TestPostgresListenerService(MAASServerTestCase):
         self.assertIs(result, sentinel.retry)
         deferLater.assert_called_with(reactor, 3, ANY)
 
+    def test_nextBackoff_doubles_and_caps_then_resets(self):
+        listener = PostgresListenerService()
+        self.assertEqual(
+            [listener._nextBackoff() for _ in range(7)],
+            [3, 6, 12, 24, 48, 60, 60],
+        )
+        listener._connectionAttempts = 0
+        self.assertEqual(listener._nextBackoff(), 3)
+
     @wait_for_reactor
     @inlineCallbacks
     def test_tryConnection_will_not_retry_if_autoReconnect_not_set(self):
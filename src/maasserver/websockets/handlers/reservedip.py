@@ -3,6 +3,8 @@
 
 """The Reserved IP handler for the WebSocket connection"""
 
+from typing import NamedTuple
+
 from django.db.models.query import QuerySet
 
 from maasserver.dhcp import configure_dhcp_on_agents
@@ -19,6 +21,16 @@ from maasserver.websockets.handlers.timestampedmodel import (
 )
 
 
+class NodeSummary(NamedTuple):
+    """Node details shown next to a reserved IP in list views."""
+
+    fqdn: str
+    hostname: str
+    node_type: int
+    system_id: str
+    via: str
+
+
 class ReservedIPHandler(TimestampedModelHandler):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -39,26 +51,40 @@ class ReservedIPHandler(TimestampedModelHandler):
     def _load_extra_data_before_dehydrate(self, objs, for_list=False):
         # We want to fetch all the nodes related to the reserved ips in just one shot.
         if for_list:
-            objs = list(objs)
-            interfaces = Interface.objects.prefetch_related(
-                "node_config__node", "node_config__node__domain"
-            ).filter(mac_address__in=[x.mac_address for x in objs])
+            mac_addresses = {x.mac_address for x in objs}
+            rows = Interface.objects.filter(
+                mac_address__in=mac_addresses,
+                node_config__node__isnull=False,
+            ).values(
+                "mac_address",
+                "name",
+                "node_config__node__hostname",
+                "node_config__node__domain__name",
+                "node_config__node__node_type",
+                "node_config__node__system_id",
+            )
             self._node_summary_cache = {}
-            for interface in interfaces:
-                node = interface.get_node()
-                self._node_summary_cache[interface.mac_address] = {
-                    "fqdn": node.fqdn,
-                    "hostname": node.hostname,
-                    "node_type": node.node_type,
-                    "system_id": node.system_id,
-                    "via": interface.name,
-                }
+            for row in rows:
+                hostname = row["node_config__node__hostname"]
+                domain_name = row["node_config__node__domain__name"]
+                self._node_summary_cache[row["mac_address"]] = NodeSummary(
+                    fqdn=(
+                        f"{hostname}.{domain_name}"
+                        if domain_name
+                        else hostname
+                    ),
+                    hostname=hostname,
+                    node_type=row["node_config__node__node_type"],
+                    system_id=row["node_config__node__system_id"],
+                    via=row["name"],
+                )
 
     def dehydrate(self, obj, data: dict, for_list: bool = False) -> dict:
         if for_list:
             # Use None if the reserved ip is not linked to any known interface/node.
-            data["node_summary"] = self._node_summary_cache.get(
-                data["mac_address"], None
+            summary = self._node_summary_cache.get(data["mac_address"])
+            data["node_summary"] = (
+                summary._asdict() if summary is not None else None
             )
         return data
 
@@ -282,11 +282,9 @@ class TestReservedIPHandler(MAASServerTestCase):
         num_queries, reserved_ips = count_queries(handler.list, {})
         self.assertEqual(len(reserved_ips), 1)
         # 1 - get the list of reserved ips
-        # 2 - get list of interfaces for all the mac addresses
-        # 3 - get list of node configs
-        # 4 - get list of nodes
-        # 5 - get list of domains
-        self.assertEqual(num_queries, 5)
+        # 2 - get the node summaries for all the mac addresses in one
+        #     joined query
+        self.assertEqual(num_queries, 2)
         self.assertEqual(
             [
                 {
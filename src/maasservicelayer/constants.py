@@ -1,4 +1,4 @@
 NODE_INIT_USERNAME = "maas-init-node"
 WORKER_USERNAME = "MAAS"
 
-SYSTEM_USERS = [NODE_INIT_USERNAME, WORKER_USERNAME]
+SYSTEM_USERS = frozenset({NODE_INIT_USERNAME, WORKER_USERNAME})
@@ -153,7 +153,13 @@ class ClauseFactory:
         joins = []
         for clause in clauses:
             if clause.joins is not None:
-                joins.extend(clause.joins)
+                for join in clause.joins:
+                    # Composite filters often share path joins, e.g.
+                    # IPRangeClauseFactory.with_vlan_id and with_fabric_id
+                    # both join the subnet table. Keep a single copy so the
+                    # combined clause carries a clean join graph.
+                    if all(not join.compare(existing) for existing in joins):
+                        joins.append(join)
         return joins
 
     @classmethod
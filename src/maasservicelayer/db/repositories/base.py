@@ -206,7 +206,8 @@ class ReadOnlyRepository(Repository, Generic[T]):
         stmt = query.enrich_stmt(stmt)
 
         result = (await self.execute_stmt(stmt)).all()
-        return [self.get_model_factory()(**row._asdict()) for row in result]
+        model_factory = self.get_model_factory()
+        return [model_factory(**row._asdict()) for row in result]
 
     async def list(
         self, page: int, size: int, query: QuerySpec | None = None
@@ -228,10 +229,9 @@ class ReadOnlyRepository(Repository, Generic[T]):
             stmt = query.enrich_stmt(stmt)
 
         result = (await self.execute_stmt(stmt)).all()
+        model_factory = self.get_model_factory()
         return ListResult[T](
-            items=[
-                self.get_model_factory()(**row._asdict()) for row in result
-            ],
+            items=[model_factory(**row._asdict()) for row in result],
             total=total,
         )
 
@@ -281,9 +281,8 @@ class BaseRepository(ReadOnlyRepository[T], Generic[T]):
 
         try:
             result = (await self.execute_stmt(stmt)).all()
-            return [
-                self.get_model_factory()(**row._asdict()) for row in result
-            ]
+            model_factory = self.get_model_factory()
+            return [model_factory(**row._asdict()) for row in result]
         except IntegrityError:
             self._raise_already_existing_exception()
 
@@ -291,10 +290,8 @@ class BaseRepository(ReadOnlyRepository[T], Generic[T]):
         self, query: QuerySpec, builder: ResourceBuilder
     ) -> List[T]:
         updated_resources = await self._update(query, builder)
-        return [
-            self.get_model_factory()(**row._asdict())
-            for row in updated_resources
-        ]
+        model_factory = self.get_model_factory()
+        return [model_factory(**row._asdict()) for row in updated_resources]
 
     async def update_by_id(self, id: int, builder: ResourceBuilder) -> T:
         return await self.update_one(
@@ -364,7 +361,8 @@ class BaseRepository(ReadOnlyRepository[T], Generic[T]):
         )
         stmt = query.enrich_stmt(stmt)
         results = (await self.execute_stmt(stmt)).all()
-        return [self.get_model_factory()(**row._asdict()) for row in results]
+        model_factory = self.get_model_factory()
+        return [model_factory(**row._asdict()) for row in results]
 
     def _raise_already_existing_exception(self):
         raise AlreadyExistsException(
@@ -3,7 +3,7 @@
 
 from typing import Any, List, Type
 
-from sqlalchemy import delete, desc, insert, Select, select, Table
+from sqlalchemy import case, delete, desc, insert, Select, select, Table
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.sql.expression import func
 from sqlalchemy.sql.functions import count
@@ -50,16 +50,166 @@ def build_interface_links(
     interface: dict[str, list[dict[str, Any]]], reverse=True
 ) -> dict[str, list[Link]]:
     if links := interface.pop("links"):
-        one_link_per_id = {
-            link["id"]: Link(**link) for link in links if any(link.values())
-        }
-        sorted_links = sorted(
-            one_link_per_id.values(), key=lambda link: link.id, reverse=reverse
-        )
-        interface["links"] = sorted_links  # type: ignore
+        # Sort the raw dicts in place and deduplicate while walking them,
+        # so that only the retained links are materialized as Link models.
+        links.sort(key=lambda link: link["id"] or 0, reverse=reverse)
+        seen = set()
+        deduped_links = []
+        for link in links:
+            link_id = link["id"]
+            if link_id in seen:
+                continue
+            seen.add(link_id)
+            # DHCP links expose the address the node actually leased, which
+            # is tracked by the matching DISCOVERED address on the same
+            # subnet and emitted by the select statement as "discovered_ip".
+            discovered_ip = link.pop("discovered_ip", None)
+            if (
+                link["ip_type"] == IpAddressType.DHCP
+                and discovered_ip is not None
+            ):
+                link["ip_address"] = discovered_ip
+            deduped_links.append(Link(**link))
+        interface["links"] = deduped_links  # type: ignore
     return interface  # type: ignore
 
 
+def _build_select_all_statement() -> Select[Any]:
+    ip_subquery = (
+        select(
+            InterfaceIPAddressTable.c.interface_id.label("interface_id"),
+            StaticIPAddressTable.c.subnet_id.label("ip_subnet"),
+            StaticIPAddressTable.c.id.label("ip_id"),
+            StaticIPAddressTable.c.alloc_type.label("ip_type"),
+            StaticIPAddressTable.c.ip.label("ip_address"),
+        )
+        .where(
+            eq(
+                InterfaceIPAddressTable.c.staticipaddress_id,
+                StaticIPAddressTable.c.id,
+            ),
+            StaticIPAddressTable.c.alloc_type != IpAddressType.DISCOVERED,
+        )
+        .order_by(desc(StaticIPAddressTable.c.id))
+        .alias("ip_subquery")
+    )
+
+    # The address a DHCP link actually leased is tracked by the
+    # DISCOVERED address on the same subnet for one of the interfaces
+    # of the same node config. Fetch it together with the link so that
+    # no extra round-trip is needed afterwards.
+    discovered_sip = StaticIPAddressTable.alias("discovered_sip")
+    discovered_iia = InterfaceIPAddressTable.alias("discovered_iia")
+    discovered_iface = InterfaceTable.alias("discovered_iface")
+    discovered_ip_subquery = (
+        select(discovered_sip.c.ip)
+        .select_from(discovered_sip)
+        .join(
+            discovered_iia,
+            eq(discovered_iia.c.staticipaddress_id, discovered_sip.c.id),
+        )
+        .join(
+            discovered_iface,
+            eq(discovered_iface.c.id, discovered_iia.c.interface_id),
+        )
+        .where(
+            eq(discovered_sip.c.alloc_type, IpAddressType.DISCOVERED),
+            eq(discovered_sip.c.subnet_id, ip_subquery.c.ip_subnet),
+            eq(
+                discovered_iface.c.node_config_id,
+                InterfaceTable.c.node_config_id,
+            ),
+        )
+        .limit(1)
+        .scalar_subquery()
+    )
+
+    return (
+        select(
+            NodeTable.c.id.label("node_id"),
+            InterfaceTable.c.id,
+            InterfaceTable.c.created,
+            InterfaceTable.c.updated,
+            InterfaceTable.c.name,
+            InterfaceTable.c.type,
+            InterfaceTable.c.mac_address,
+            InterfaceTable.c.node_config_id,
+            # TODO
+            # VlanTable.c.mtu.label("effective_mtu"),
+            InterfaceTable.c.link_connected,
+            InterfaceTable.c.interface_speed,
+            InterfaceTable.c.enabled,
+            InterfaceTable.c.link_speed,
+            InterfaceTable.c.sriov_max_vf,
+            InterfaceTable.c.vlan_id,
+            # jsonb_agg produces a single binary JSONB document decoded
+            # once by the driver, instead of a json[] array decoded one
+            # element at a time. The FILTER clause drops the all-NULL row
+            # produced by the outer join for interfaces without links.
+            func.jsonb_agg(
+                func.jsonb_build_object(
+                    "id",
+                    ip_subquery.c.ip_id,
+                    "ip_type",
+                    ip_subquery.c.ip_type,
+                    "ip_address",
+                    ip_subquery.c.ip_address,
+                    "ip_subnet",
+                    ip_subquery.c.ip_subnet,
+                    "discovered_ip",
+                    case(
+                        (
+                            eq(
+                                ip_subquery.c.ip_type,
+                                IpAddressType.DHCP,
+                            ),
+                            discovered_ip_subquery,
+                        ),
+                        else_=None,
+                    ),
+                )
+            )
+            .filter(ip_subquery.c.ip_id.isnot(None))
+            .label("links"),
+        )
+        .select_from(InterfaceTable)
+        .join(
+            NodeConfigTable,
+            eq(NodeConfigTable.c.id, InterfaceTable.c.node_config_id),
+            isouter=True,
+        )
+        .join(
+            NodeTable,
+            eq(NodeTable.c.current_config_id, NodeConfigTable.c.id),
+            isouter=True,
+        )
+        # TODO
+        # .join(
+        #     VlanTable,
+        #     eq(VlanTable.c.id, InterfaceTable.c.vlan_id),
+        #     isouter=True,
+        # )
+        .join(
+            InterfaceIPAddressTable,
+            eq(InterfaceTable.c.id, InterfaceIPAddressTable.c.interface_id),
+            isouter=True,
+        )
+        .join(
+            ip_subquery,
+            eq(ip_subquery.c.interface_id, InterfaceTable.c.id),
+            isouter=True,
+        )
+        .group_by(
+            NodeTable.c.id,
+            InterfaceTable.c.id,
+            # VlanTable.c.mtu,
+        )
+    )
+
+
+_SELECT_ALL_STATEMENT = _build_select_all_statement()
+
+
 class InterfaceRepository(BaseRepository):
     def get_repository_table(self) -> Table:
         return InterfaceTable
@@ -70,25 +220,12 @@ class InterfaceRepository(BaseRepository):
     async def list_for_node(
         self, node_id: int, page: int, size: int
     ) -> ListResult[Interface]:
-        total_stmt = (
-            select(count())
-            .select_from(InterfaceTable)
-            .join(
-                NodeConfigTable,
-                eq(NodeConfigTable.c.id, InterfaceTable.c.node_config_id),
-                isouter=True,
-            )
-            .join(
-                NodeTable,
-                eq(NodeTable.c.current_config_id, NodeConfigTable.c.id),
-                isouter=True,
-            )
-            .where(eq(NodeTable.c.id, node_id))
-        )
-        total = (await self.execute_stmt(total_stmt)).scalar_one()
-
+        # The window function counts the interfaces matching the filter
+        # before LIMIT is applied, so rows and total come back in a single
+        # round-trip instead of issuing a separate count query.
         stmt = (
             self._select_all_statement()
+            .add_columns(func.count().over().label("total"))
             .where(eq(NodeTable.c.id, node_id))
             .order_by(desc(InterfaceTable.c.id))
             .offset((page - 1) * size)
@@ -97,8 +234,35 @@ class InterfaceRepository(BaseRepository):
 
         result = (await self.execute_stmt(stmt)).all()
 
-        interfaces = [build_interface_links(row._asdict()) for row in result]
-        await self._find_discovered_ip_for_dhcp_links(interfaces, node_id)
+        if result:
+            total = result[0].total
+        else:
+            # A page past the last row comes back empty and carries no
+            # window count; fall back to a plain count so out-of-range
+            # pages still report the true total like the other
+            # repositories do.
+            total_stmt = (
+                select(count())
+                .select_from(InterfaceTable)
+                .join(
+                    NodeConfigTable,
+                    eq(NodeConfigTable.c.id, InterfaceTable.c.node_config_id),
+                    isouter=True,
+                )
+                .join(
+                    NodeTable,
+                    eq(NodeTable.c.current_config_id, NodeConfigTable.c.id),
+                    isouter=True,
+                )
+                .where(eq(NodeTable.c.id, node_id))
+            )
+            total = (await self.execute_stmt(total_stmt)).scalar_one()
+
+        interfaces = []
+        for row in result:
+            interface = row._asdict()
+            del interface["total"]
+            interfaces.append(build_interface_links(interface))
 
         return ListResult[Interface](
             items=[Interface(**iface) for iface in interfaces],  # pyright: ignore [reportArgumentType]
@@ -199,163 +363,11 @@ class InterfaceRepository(BaseRepository):
         created_instance = (await self.execute_stmt(get_instance)).one()
         return Interface(**build_interface_links(created_instance._asdict()))  # pyright: ignore [reportArgumentType]
 
-    async def _find_discovered_ip_for_dhcp_links(
-        self, interfaces, node_id
-    ) -> None:
-        if any(
-            link.ip_type == IpAddressType.DHCP
-            for iface in interfaces
-            for link in iface["links"]
-        ):
-            discovered_ips = [
-                discovered._asdict()
-                for discovered in (
-                    await self.execute_stmt(
-                        self._discovered_ip_statement().where(
-                            eq(NodeTable.c.id, node_id)
-                        )
-                    )
-                ).all()
-            ]
-            for iface in interfaces:
-                for link in iface["links"]:
-                    if link.ip_type == IpAddressType.DHCP:
-                        if ip := next(
-                            filter(
-                                lambda ip: ip["ip_subnet"] == link.ip_subnet,
-                                discovered_ips,
-                            ),
-                            None,
-                        ):
-                            link.ip_address = ip["ip_address"]
-
-    def _discovered_ip_statement(self) -> Select[Any]:
-        return (
-            select(
-                StaticIPAddressTable.c.subnet_id.label("ip_subnet"),
-                StaticIPAddressTable.c.ip.label("ip_address"),
-            )
-            .select_from(NodeTable)
-            .where(
-                eq(
-                    StaticIPAddressTable.c.alloc_type,
-                    IpAddressType.DISCOVERED,
-                )
-            )
-            .join(
-                NodeConfigTable,
-                eq(NodeTable.c.current_config_id, NodeConfigTable.c.id),
-                isouter=True,
-            )
-            .join(
-                InterfaceTable,
-                eq(NodeConfigTable.c.id, InterfaceTable.c.node_config_id),
-                isouter=True,
-            )
-            .join(
-                InterfaceIPAddressTable,
-                eq(
-                    InterfaceTable.c.id, InterfaceIPAddressTable.c.interface_id
-                ),
-                isouter=True,
-            )
-            .join(
-                StaticIPAddressTable,
-                eq(
-                    InterfaceIPAddressTable.c.staticipaddress_id,
-                    StaticIPAddressTable.c.id,
-                ),
-                isouter=True,
-            )
-            .distinct(StaticIPAddressTable.c.subnet_id)
-        )
-
     def _select_all_statement(self) -> Select[Any]:
-        ip_subquery = (
-            select(
-                InterfaceIPAddressTable.c.interface_id.label("interface_id"),
-                StaticIPAddressTable.c.subnet_id.label("ip_subnet"),
-                StaticIPAddressTable.c.id.label("ip_id"),
-                StaticIPAddressTable.c.alloc_type.label("ip_type"),
-                StaticIPAddressTable.c.ip.label("ip_address"),
-            )
-            .where(
-                eq(
-                    InterfaceIPAddressTable.c.staticipaddress_id,
-                    StaticIPAddressTable.c.id,
-                ),
-                StaticIPAddressTable.c.alloc_type != IpAddressType.DISCOVERED,
-            )
-            .order_by(desc(StaticIPAddressTable.c.id))
-            .alias("ip_subquery")
-        )
-
-        return (
-            select(
-                NodeTable.c.id.label("node_id"),
-                InterfaceTable.c.id,
-                InterfaceTable.c.created,
-                InterfaceTable.c.updated,
-                InterfaceTable.c.name,
-                InterfaceTable.c.type,
-                InterfaceTable.c.mac_address,
-                InterfaceTable.c.node_config_id,
-                # TODO
-                # VlanTable.c.mtu.label("effective_mtu"),
-                InterfaceTable.c.link_connected,
-                InterfaceTable.c.interface_speed,
-                InterfaceTable.c.enabled,
-                InterfaceTable.c.link_speed,
-                InterfaceTable.c.sriov_max_vf,
-                InterfaceTable.c.vlan_id,
-                func.array_agg(
-                    func.json_build_object(
-                        "id",
-                        ip_subquery.c.ip_id,
-                        "ip_type",
-                        ip_subquery.c.ip_type,
-                        "ip_address",
-                        ip_subquery.c.ip_address,
-                        "ip_subnet",
-                        ip_subquery.c.ip_subnet,
-                    )
-                ).label("links"),
-            )
-            .select_from(InterfaceTable)
-            .join(
-                NodeConfigTable,
-                eq(NodeConfigTable.c.id, InterfaceTable.c.node_config_id),
-                isouter=True,
-            )
-            .join(
-                NodeTable,
-                eq(NodeTable.c.current_config_id, NodeConfigTable.c.id),
-                isouter=True,
-            )
-            # TODO
-            # .join(
-            #     VlanTable,
-            #     eq(VlanTable.c.id, InterfaceTable.c.vlan_id),
-            #     isouter=True,
-            # )
-            .join(
-                InterfaceIPAddressTable,
-                eq(
-                    InterfaceTable.c.id, InterfaceIPAddressTable.c.interface_id
-                ),
-                isouter=True,
-            )
-            .join(
-                ip_subquery,
-                eq(ip_subquery.c.interface_id, InterfaceTable.c.id),
-                isouter=True,
-            )
-            .group_by(
-                NodeTable.c.id,
-                InterfaceTable.c.id,
-                # VlanTable.c.mtu,
-            )
-        )
+        # The statement never changes structurally, so build it once at
+        # import time: Select objects are immutable, and .where() or
+        # .join() on the shared statement return copies.
+        return _SELECT_ALL_STATEMENT
 
     async def get_for_ip(self, ip_id: int) -> list[Interface] | None:
         stmt = (
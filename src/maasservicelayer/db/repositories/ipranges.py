@@ -4,7 +4,6 @@
 from operator import eq
 from typing import Type
 
-import netaddr
 from pydantic import IPvAnyAddress
 from sqlalchemy import join, select, Table
 
@@ -86,26 +85,19 @@ class IPRangesRepository(BaseRepository[IPRange]):
     async def get_dynamic_range_for_ip(
         self, subnet_id: int, ip: IPvAnyAddress
     ) -> IPRange | None:
+        # Range containment is evaluated by PostgreSQL on the inet columns,
+        # so at most one row travels back instead of every range in the
+        # subnet being materialized and scanned in Python.
         stmt = (
             select(IPRangeTable)
-            .select_from(IPRangeTable)
-            .join(
-                SubnetTable,
-                SubnetTable.c.id == IPRangeTable.c.subnet_id,
+            .where(
+                IPRangeTable.c.subnet_id == subnet_id,
+                IPRangeTable.c.type == IPRangeType.DYNAMIC,
+                IPRangeTable.c.start_ip <= str(ip),
+                IPRangeTable.c.end_ip >= str(ip),
             )
-            .filter(SubnetTable.c.id == subnet_id)
+            .limit(1)
         )
 
-        result = (await self.execute_stmt(stmt)).all()
-
-        ipranges = [IPRange(**row._asdict()) for row in result]
-
-        netaddr_ip = netaddr.IPAddress(str(ip))
-
-        for iprange in ipranges:
-            if netaddr_ip in netaddr.IPRange(
-                str(iprange.start_ip), str(iprange.end_ip)
-            ):
-                return iprange
-
-        return None
+        result = (await self.execute_stmt(stmt)).one_or_none()
+        return IPRange(**result._asdict()) if result else None
@@ -80,6 +80,12 @@ class ResourceBuilder(BaseModel):
         """
 
         arbitrary_types_allowed = True
+        # Builders are instantiated on every write path, so keep pydantic's
+        # per-field work to a minimum: pick the matching Union member
+        # directly instead of trying to coerce to each one in order, and
+        # don't deep-copy nested models during validation.
+        smart_union = True
+        copy_on_model_validation = "none"
 
     def __eq__(self, other):
         # Pydantic is not comparing nested objects. This is the workaround to do it.
@@ -14,3 +14,9 @@ class Domain(MaasTimestampedBaseModel):
     name: str
     authoritative: bool
     ttl: Optional[int]
+
+    class Config:
+        # Domains are read from the database, passed around and serialized,
+        # never mutated in place; freezing them lets pydantic skip the
+        # assignment machinery and makes sharing instances safe.
+        allow_mutation = False
@@ -72,13 +72,13 @@ power_drivers = [
     WebhookPowerDriver(),
     WedgePowerDriver(),
 ]
-for driver in power_drivers:
-    PowerDriverRegistry.register_item(driver.name, driver)
+PowerDriverRegistry.register_items(
+    {driver.name: driver for driver in power_drivers}
+)
 
 
 # Pod drivers are also power drivers.
-for driver_name, driver in PodDriverRegistry:
-    PowerDriverRegistry.register_item(driver_name, driver)
+PowerDriverRegistry.register_items(dict(PodDriverRegistry))
 
 
 def sanitise_power_parameters(power_type, power_parameters):
@@ -31,14 +31,12 @@ class TestPowerDriverRegistry(MAASTestCase):
         fake_driver_one = make_power_driver_base()
         fake_driver_two = make_power_driver_base()
         fake_pod_driver = make_pod_driver_base()
-        PowerDriverRegistry.register_item(
-            fake_driver_one.name, fake_driver_one
-        )
-        PowerDriverRegistry.register_item(
-            fake_driver_two.name, fake_driver_two
-        )
-        PowerDriverRegistry.register_item(
-            fake_pod_driver.name, fake_pod_driver
+        PowerDriverRegistry.register_items(
+            {
+                fake_driver_one.name: fake_driver_one,
+                fake_driver_two.name: fake_driver_two,
+                fake_pod_driver.name: fake_pod_driver,
+            }
         )
         self.assertEqual(
             [
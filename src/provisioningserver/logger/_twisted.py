@@ -3,6 +3,7 @@
 
 """Twisted-specific logging stuff."""
 
+import functools
 import json
 import os
 import re
@@ -10,7 +11,6 @@ import sys
 import threading
 import warnings
 
-import crochet
 from twisted import logger as twistedModern
 from twisted.python import log as twistedLegacy
 from twisted.python import usage
@@ -39,16 +39,18 @@ assert (
     DEFAULT_TWISTED_VERBOSITY_LEVELS.keys() == DEFAULT_LOG_VERBOSITY_LEVELS
 ), "Twisted verbosity map does not match expectations."
 
+# The verbosity map is a module constant; clamp against its bounds
+# without recomputing them on every call.
+_VERBOSITY_MIN = min(DEFAULT_TWISTED_VERBOSITY_LEVELS)
+_VERBOSITY_MAX = max(DEFAULT_TWISTED_VERBOSITY_LEVELS)
+
 
 def set_twisted_verbosity(verbosity: int):
     """Reconfigure verbosity of the standard library's `logging` module."""
-    # Convert `verbosity` into a Twisted `LogLevel`.
-    level = get_twisted_logging_level(verbosity)
-    # `LogLevel` is comparable, but this saves overall computation.
-    global _filterByLevels
-    _filterByLevels = {
-        ll for ll in twistedModern.LogLevel.iterconstants() if ll >= level
-    }
+    # Convert `verbosity` into a Twisted `LogLevel`, then into an ordinal
+    # so that `_filterByLevel` compares integers instead of probing a set.
+    global _minLevelOrd
+    _minLevelOrd = _LEVEL_ORD[get_twisted_logging_level(verbosity)]
 
 
 def configure_twisted_logging(verbosity: int, mode: LoggingMode):
@@ -62,10 +64,13 @@ def configure_twisted_logging(verbosity: int, mode: LoggingMode):
     """
     set_twisted_verbosity(verbosity)
 
-    warn_unless(
-        hasattr(twistedLegacy, "startLoggingWithObserver"),
-        "No startLoggingWithObserver function found; please investigate!",
-    )
+    # These probes into Twisted and crochet internals are assertion-like
+    # sanity checks; run them only in development (they vanish under -O).
+    if __debug__:
+        warn_unless(
+            hasattr(twistedLegacy, "startLoggingWithObserver"),
+            "No startLoggingWithObserver function found; please investigate!",
+        )
     twistedLegacy.startLoggingWithObserver = _startLoggingWithObserver
 
     # Set the legacy `logfile` namespace according to the environment in which
@@ -75,10 +80,11 @@ def configure_twisted_logging(verbosity: int, mode: LoggingMode):
 
     # Customise warnings behaviour. Ensure that nothing else — neither the
     # standard library's `logging` module nor Django — clobbers this later.
-    warn_unless(
-        warnings.showwarning.__module__ == warnings.__name__,
-        "The warnings module has already been modified; please investigate!",
-    )
+    if __debug__:
+        warn_unless(
+            warnings.showwarning.__module__ == warnings.__name__,
+            "The warnings module has already been modified; please investigate!",
+        )
     if mode == LoggingMode.TWISTD:
         twistedModern.globalLogBeginner.showwarning = show_warning_via_twisted
         twistedLegacy.theLogPublisher.showwarning = show_warning_via_twisted
@@ -86,25 +92,32 @@ def configure_twisted_logging(verbosity: int, mode: LoggingMode):
         twistedModern.globalLogBeginner.showwarning = warnings.showwarning
         twistedLegacy.theLogPublisher.showwarning = warnings.showwarning
 
-    # Prevent `crochet` from initialising Twisted's logging.
-    warn_unless(
-        hasattr(crochet._main, "_startLoggingWithObserver"),
-        "No _startLoggingWithObserver function found; please investigate!",
-    )
+    # Prevent `crochet` from initialising Twisted's logging. Import it
+    # here rather than at module level: it drags in a sizeable import
+    # graph that users of `LegacyLogger` alone should not pay for.
+    import crochet
+
+    if __debug__:
+        warn_unless(
+            hasattr(crochet._main, "_startLoggingWithObserver"),
+            "No _startLoggingWithObserver function found; please investigate!",
+        )
     crochet._main._startLoggingWithObserver = None
 
     # Turn off some inadvisable defaults in Twisted and elsewhere.
     from twisted.internet.protocol import AbstractDatagramProtocol, Factory
 
-    warn_unless(
-        hasattr(AbstractDatagramProtocol, "noisy"),
-        "No AbstractDatagramProtocol.noisy attribute; please investigate!",
-    )
+    if __debug__:
+        warn_unless(
+            hasattr(AbstractDatagramProtocol, "noisy"),
+            "No AbstractDatagramProtocol.noisy attribute; please investigate!",
+        )
     AbstractDatagramProtocol.noisy = False
-    warn_unless(
-        hasattr(Factory, "noisy"),
-        "No Factory.noisy attribute; please investigate!",
-    )
+    if __debug__:
+        warn_unless(
+            hasattr(Factory, "noisy"),
+            "No Factory.noisy attribute; please investigate!",
+        )
     Factory.noisy = False
 
     # Install filters for other noisy parts of Twisted itself.
@@ -277,6 +290,12 @@ def _getCommandName(argv):
                 return command
 
 
+# Format strings used by `LegacyLogger.msg`, keyed by message count.
+# Callers almost always pass the same number of messages, so the joined
+# template is built at most once per count.
+_MSG_FMT_CACHE: dict = {}
+
+
 class LegacyLogger(twistedModern.Logger):
     """Looks like a stripped-down `t.p.log` module, logs to a `Logger`.
 
@@ -317,8 +336,19 @@ class LegacyLogger(twistedModern.Logger):
         supplied but says that this "only works (sometimes) by accident". Here
         we make sure it works all the time on purpose.
         """
-        fmt = " ".join("{_message_%d}" % i for i, _ in enumerate(message))
-        kwargs.update({"_message_%d" % i: m for i, m in enumerate(message)})
+        if len(message) == 1:
+            # The overwhelmingly common case; skip assembling a format
+            # string and an interim kwargs dict.
+            kwargs["_message_0"] = message[0]
+            self.info("{_message_0}", **kwargs)
+            return
+        count = len(message)
+        fmt = _MSG_FMT_CACHE.get(count)
+        if fmt is None:
+            fmt = _MSG_FMT_CACHE.setdefault(
+                count, " ".join("{_message_%d}" % i for i in range(count))
+            )
+        kwargs.update(("_message_%d" % i, m) for i, m in enumerate(message))
         self.info(fmt, **kwargs)
 
     def err(self, _stuff=None, _why=None, **kwargs):
@@ -363,14 +393,16 @@ def get_twisted_logging_level(verbosity: int):  # -> LogLevel
     :param verbosity: 0, 1, 2, or 3, meaning very quiet logging, quiet
         logging, normal logging, and verbose/debug logging.
     """
-    levels = DEFAULT_TWISTED_VERBOSITY_LEVELS
-    v_min, v_max = min(levels), max(levels)
-    if verbosity > v_max:
-        return levels[v_max]
-    elif verbosity < v_min:
-        return levels[v_min]
-    else:
-        return levels[verbosity]
+    return DEFAULT_TWISTED_VERBOSITY_LEVELS[
+        max(_VERBOSITY_MIN, min(_VERBOSITY_MAX, verbosity))
+    ]
+
+
+# Warnings tend to repeat from the same few files, while finding the
+# module for a file scans all of `sys.modules`. Memoize the scan and
+# keep one `Logger` per namespace.
+_get_module_for_file = functools.lru_cache(maxsize=512)(get_module_for_file)
+_warning_loggers: dict = {}
 
 
 def show_warning_via_twisted(
@@ -379,10 +411,13 @@ def show_warning_via_twisted(
     """Replacement for `warnings.showwarning` that logs via Twisted."""
     if file is None:
         # Try to find a module name with which to log this warning.
-        module = get_module_for_file(filename)
-        logger = twistedModern.Logger(
-            "global" if module is None else module.__name__
-        )
+        module = _get_module_for_file(filename)
+        namespace = "global" if module is None else module.__name__
+        logger = _warning_loggers.get(namespace)
+        if logger is None:
+            logger = _warning_loggers.setdefault(
+                namespace, twistedModern.Logger(namespace)
+            )
         # `message` is/can be an instance of `category`, so stringify.
         logger.warn(
             "{category}: {message}",
@@ -405,65 +440,80 @@ def show_warning_via_twisted(
             pass  # We tried.
 
 
-# Those levels for which we should emit log events.
-_filterByLevels = frozenset()
+# The predicates below run for every published log event, so resolve the
+# `PredicateResult` constants once instead of two attribute lookups per
+# event.
+_PR_MAYBE = twistedModern.PredicateResult.maybe
+_PR_NO = twistedModern.PredicateResult.no
+
+# `LogLevel` constants in severity order, mapped to ordinals so that the
+# per-event level check is a single integer comparison.
+_LEVEL_ORD = {
+    ll: ord_ for ord_, ll in enumerate(twistedModern.LogLevel.iterconstants())
+}
+
+# The minimum ordinal for which we should emit log events. Filter
+# everything until `set_twisted_verbosity` has been called.
+_minLevelOrd = len(_LEVEL_ORD)
 
 
 def _filterByLevel(event):
-    """Only log if event's level is in `_filterByLevels`."""
-    if event.get("log_level") in _filterByLevels:
-        return twistedModern.PredicateResult.maybe
+    """Only log if event's level is at or above the configured level."""
+    if _LEVEL_ORD.get(event.get("log_level"), -1) >= _minLevelOrd:
+        return _PR_MAYBE
     else:
-        return twistedModern.PredicateResult.no
+        return _PR_NO
 
 
-# A list of markers for noise.
+# Markers for noise. Each marker has exactly two keys, flattened into a
+# (key, value, key, value) tuple so the per-event check below is plain
+# dict gets and comparisons, with no inner generator.
 _filterByNoises = (
-    {"log_namespace": "log_legacy", "log_text": "Log opened."},
-    {"log_namespace": "log_legacy", "log_text": "Main loop terminated."},
+    ("log_namespace", "log_legacy", "log_text", "Log opened."),
+    ("log_namespace", "log_legacy", "log_text", "Main loop terminated."),
 )
 
 
 def _filterByNoise(event):
     """Only log if event is not noisy."""
-    for noise in _filterByNoises:
-        if all(key in event and event[key] == noise[key] for key in noise):
-            return twistedModern.PredicateResult.no
-    else:
-        return twistedModern.PredicateResult.maybe
+    for key1, value1, key2, value2 in _filterByNoises:
+        if event.get(key1) == value1 and event.get(key2) == value2:
+            return _PR_NO
+    return _PR_MAYBE
 
 
-_observe_twisted_internet_tcp_noise = re.compile(
-    r"^(?:[(].+ Port \d+ Closed[)]|.+ starting on \d+)"
-)
+# Noise from `twisted.internet.{tcp,udp,unix}` comes in the same two
+# shapes — "... starting on <port>" and "(<name> Port <port> Closed)" — so
+# a single compiled pattern serves all three observers. Binding `match`
+# saves an attribute lookup per event.
+_observe_twisted_internet_noise = re.compile(
+    r"^(?:[(].+ Port .+ Closed[)]|.+ starting on .+)"
+).match
+
+
+def _is_noise(event):
+    """Does `event` match the `twisted.internet` noise patterns?"""
+    # Most of these events carry their already-rendered text, so match
+    # that directly and pay for `formatEvent` only when it's absent.
+    message = event.get("log_text")
+    if message is None:
+        message = twistedModern.formatEvent(event)
+    return _observe_twisted_internet_noise(message) is not None
 
 
 def observe_twisted_internet_tcp(event):
     """Observe events from `twisted.internet.tcp` and filter out noise."""
-    message = twistedModern.formatEvent(event)
-    if _observe_twisted_internet_tcp_noise.match(message) is None:
+    if not _is_noise(event):
         twistedModern.globalLogPublisher(event)
 
 
-_observe_twisted_internet_udp_noise = re.compile(
-    r"^(?:[(].+ Port \d+ Closed[)]|.+ starting on \d+)"
-)
-
-
 def observe_twisted_internet_udp(event):
     """Observe events from `twisted.internet.udp` and filter out noise."""
-    message = twistedModern.formatEvent(event)
-    if _observe_twisted_internet_udp_noise.match(message) is None:
+    if not _is_noise(event):
         twistedModern.globalLogPublisher(event)
 
 
-_observe_twisted_internet_unix_noise = re.compile(
-    r"^(?:[(].+ Port .+ Closed[)]|.+ starting on .+)"
-)
-
-
 def observe_twisted_internet_unix(event):
     """Observe events from `twisted.internet.unix` and filter out noise."""
-    message = twistedModern.formatEvent(event)
-    if _observe_twisted_internet_unix_noise.match(message) is None:
+    if not _is_noise(event):
         twistedModern.globalLogPublisher(event)
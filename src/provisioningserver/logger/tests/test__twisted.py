@@ -471,11 +471,10 @@ class TestEventLogger(MAASTestCase):
         settings.USE_JSON_LOGGING = False
 
     def setLogLevel(self, log_level):
-        """Set the level at which events will be logged.
-
-        This is not a minimum level, it is an absolute level.
-        """
-        self.patch(_twisted, "_filterByLevels", {self.log_level})
+        """Set the minimum level at which events will be logged."""
+        self.patch(
+            _twisted, "_minLevelOrd", _twisted._LEVEL_ORD[self.log_level]
+        )
 
     def test_basics(self):
         self.setLogLevel(self.log_level)
@@ -495,9 +494,13 @@ class TestEventLogger(MAASTestCase):
         }
         for event in events.values():
             self.log(event)
-        # Only the log at the current level will get through.
+        # Only the logs at or above the current level will get through.
         self.assertSequenceEqual(
-            [("-", self.log_level.name, events[self.log_level]["log_text"])],
+            [
+                ("-", log_level.name, events[log_level]["log_text"])
+                for log_level in logger.LogLevel.iterconstants()
+                if log_level >= self.log_level
+            ],
             self.get_logs(),
         )
 
@@ -62,6 +62,23 @@ class AsyncIteratorMock:
             raise StopAsyncIteration
 
 
+class ServicesHolder:
+    """Indirection between session-scoped apps and per-test service mocks.
+
+    Building a FastAPI app (and registering every route on it) per test is
+    expensive, so the mocked apps are created once per session and read the
+    current services mock from this holder instead of closing over it.
+    """
+
+    services: ServiceCollectionV3 | None = None
+
+
+@pytest.fixture(scope="session")
+def services_holder():
+    yield ServicesHolder()
+
+
 @pytest.fixture
-def services_mock():
-    yield Mock(ServiceCollectionV3)
+def services_mock(services_holder: ServicesHolder):
+    services_holder.services = Mock(ServiceCollectionV3)
+    yield services_holder.services
@@ -21,3 +21,22 @@ async def create_test_fabric_entry(
         [fabric],
     )
     return Fabric(**created_fabric)
+
+
+async def create_n_test_fabric_entries(
+    fixture: Fixture, size: int
+) -> list[Fabric]:
+    now = datetime.now(timezone.utc)
+    fabric = {
+        "created": now,
+        "updated": now,
+    }
+
+    all_fabrics = [
+        fabric | {"name": str(i), "description": str(i)} for i in range(size)
+    ]
+    created_fabrics = await fixture.create(
+        "maasserver_fabric",
+        all_fabrics,
+    )
+    return [Fabric(**created_fabric) for created_fabric in created_fabrics]
@@ -33,14 +33,13 @@ async def generate_node_system_id(db_connection: AsyncConnection):
     )
 
 
-async def _create_test_node_entry(
-    fixture: Fixture,
+def _make_node_details(
+    system_id: str,
     node_type: NodeTypeEnum,
     **extra_details: Any,
 ) -> dict[str, Any]:
     created_at = datetime.now(timezone.utc).astimezone()
     updated_at = datetime.now(timezone.utc).astimezone()
-    system_id = await generate_node_system_id(fixture.conn)
     node = {
         "created": created_at,
         "updated": updated_at,
@@ -80,6 +79,16 @@ async def _create_test_node_entry(
         "is_dpu": False,
     }
     node.update(extra_details)
+    return node
+
+
+async def _create_test_node_entry(
+    fixture: Fixture,
+    node_type: NodeTypeEnum,
+    **extra_details: Any,
+) -> dict[str, Any]:
+    system_id = await generate_node_system_id(fixture.conn)
+    node = _make_node_details(system_id, node_type, **extra_details)
     [created_node] = await fixture.create(
         "maasserver_node",
         [node],
@@ -96,6 +105,25 @@ async def create_test_machine_entry(
     )
 
 
+async def create_n_test_machine_entries(
+    fixture: Fixture,
+    size: int,
+    **extra_details: Any,
+) -> list[dict[str, Any]]:
+    nodes = [
+        _make_node_details(
+            await generate_node_system_id(fixture.conn),
+            NodeTypeEnum.MACHINE,
+            **extra_details,
+        )
+        for _ in range(size)
+    ]
+    return await fixture.create(
+        "maasserver_node",
+        nodes,
+    )
+
+
 async def create_test_device_entry(
     fixture: Fixture,
     **extra_details: Any,
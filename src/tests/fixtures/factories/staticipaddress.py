@@ -84,3 +84,52 @@ async def create_test_staticipaddress_entry(
         created_staticipaddresses.append(discovered_ip)
 
     return created_staticipaddresses
+
+
+async def create_n_test_staticipaddress_entries(
+    fixture: Fixture,
+    size: int,
+    subnet: dict[str, Any],
+    **extra_details: Any,
+) -> list[dict[str, Any]]:
+    """Create `size` static IPs on `subnet` with a single INSERT.
+
+    The taken addresses are fetched once and the free ones picked in
+    Python, instead of probing the table for every candidate.  DHCP
+    addresses need a companion discovered IP, so they must go through
+    create_test_staticipaddress_entry one at a time.
+    """
+    assert extra_details.get("alloc_type") != IpAddressType.DHCP
+    now = datetime.now(timezone.utc).astimezone()
+    base = {
+        "created": now,
+        "updated": now,
+        "alloc_type": IpAddressType.AUTO,
+        "lease_time": 600,
+        "subnet_id": subnet["id"],
+    }
+    base.update(extra_details)
+
+    taken = {
+        row[0]
+        for row in await fixture.conn.execute(
+            select(StaticIPAddressTable.c.ip)
+        )
+    }
+    network = IPNetwork(str(subnet["cidr"]))
+    free_ips = []
+    ip = IPAddress(network.first)
+    while len(free_ips) < size and ip != IPAddress(network.last):
+        if ip.version == 4:
+            comp = IPv4Address(str(ip))
+        else:
+            comp = IPv6Address(str(ip))
+        if comp not in taken:
+            free_ips.append(str(ip))
+        ip = ip + 1
+    assert len(free_ips) == size, f"subnet has fewer than {size} free ips"
+
+    return await fixture.create(
+        "maasserver_staticipaddress",
+        [base | {"ip": free_ip} for free_ip in free_ips],
+    )
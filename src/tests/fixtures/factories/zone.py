@@ -5,19 +5,39 @@ from typing import Any
 from maasservicelayer.models.zones import Zone
 from tests.maasapiserver.fixtures.db import Fixture
 
+# Time-independent defaults, merged (not mutated) per call.
+_ZONE_TEMPLATE: dict[str, Any] = {
+    "name": "my_zone",
+    "description": "my_description",
+}
+
 
 async def create_test_zone(fixture: Fixture, **extra_details: Any) -> Zone:
-    created_at = datetime.now(timezone.utc).astimezone()
-    updated_at = datetime.now(timezone.utc).astimezone()
+    now = datetime.now(timezone.utc).astimezone()
     zone = {
-        "name": "my_zone",
-        "description": "my_description",
-        "created": created_at,
-        "updated": updated_at,
+        **_ZONE_TEMPLATE,
+        "created": now,
+        "updated": now,
+        **extra_details,
     }
-    zone.update(extra_details)
     [created_zone] = await fixture.create(
         "maasserver_zone",
         [zone],
     )
     return Zone(**created_zone)
+
+
+async def create_test_zones_bulk(
+    fixture: Fixture, rows: list[dict[str, Any]]
+) -> list[Zone]:
+    """Insert several zones with a single multi-row INSERT.
+
+    Each entry in `rows` overrides the factory defaults for one zone.
+    """
+    now = datetime.now(timezone.utc).astimezone()
+    zones = [
+        {**_ZONE_TEMPLATE, "created": now, "updated": now, **row}
+        for row in rows
+    ]
+    created_zones = await fixture.create("maasserver_zone", zones)
+    return [Zone(**zone) for zone in created_zones]
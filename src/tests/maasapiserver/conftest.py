@@ -1,4 +1,4 @@
-from ..fixtures import services_mock
+from ..fixtures import services_holder, services_mock
 from .fixtures.app import (
     api_app,
     api_client,
@@ -47,6 +47,7 @@ __all__ = [
     "db",
     "db_connection",
     "fixture",
+    "services_holder",
     "services_mock",
     "mock_aioresponse",
     "mocked_api_client",
@@ -9,7 +9,7 @@ from aioresponses import aioresponses
 from django.core import signing
 from fastapi import FastAPI, Response
 from fastapi.exceptions import RequestValidationError
-from httpx import AsyncClient, Headers
+from httpx import ASGITransport, AsyncClient, Headers
 from macaroonbakery import bakery
 import pytest
 from starlette.middleware.base import BaseHTTPMiddleware
@@ -40,6 +40,7 @@ from maasservicelayer.models.users import User
 from maasservicelayer.services import ServiceCollectionV3
 from maasservicelayer.services.external_auth import ExternalAuthService
 from maasservicelayer.utils.date import utcnow
+from tests.fixtures import ServicesHolder
 from tests.fixtures.factories.user import create_test_user
 from tests.maasapiserver.fixtures.db import Fixture
 
@@ -47,7 +48,7 @@ RBAC_URL = "http://rbac.example.com"
 
 
 def create_app_with_mocks(
-    mocked_services: ServiceCollectionV3,
+    services_holder: ServicesHolder,
     roles: set[UserRole] | None = None,
     external_auth: bool = False,
 ):
@@ -57,6 +58,9 @@ def create_app_with_mocks(
             request: Request,
             call_next: Callable[[Request], Awaitable[Response]],
         ) -> Response:
+            # Resolved per request so that session-scoped apps pick up
+            # the services mock of the currently running test.
+            mocked_services = services_holder.services
             request.state.services = mocked_services
             if external_auth:
                 request.state.services.external_auth.get_external_auth.return_value = ExternalAuthConfig(
@@ -126,37 +130,42 @@ def create_internal_app_with_mocks(
     return app
 
 
-@pytest.fixture
-def app_with_mocked_services(services_mock: ServiceCollectionV3):
-    yield create_app_with_mocks(services_mock)
+# The mocked apps carry no per-test state of their own — the services
+# mock is read from the holder per request — so build each of them once
+# per session instead of re-registering every route for every test.
+@pytest.fixture(scope="session")
+def app_with_mocked_services(services_holder: ServicesHolder):
+    yield create_app_with_mocks(services_holder)
 
 
-@pytest.fixture
-def app_with_mocked_services_admin(services_mock: ServiceCollectionV3):
-    yield create_app_with_mocks(services_mock, {UserRole.USER, UserRole.ADMIN})
+@pytest.fixture(scope="session")
+def app_with_mocked_services_admin(services_holder: ServicesHolder):
+    yield create_app_with_mocks(
+        services_holder, {UserRole.USER, UserRole.ADMIN}
+    )
 
 
-@pytest.fixture
-def app_with_mocked_services_user(services_mock: ServiceCollectionV3):
-    yield create_app_with_mocks(services_mock, {UserRole.USER})
+@pytest.fixture(scope="session")
+def app_with_mocked_services_user(services_holder: ServicesHolder):
+    yield create_app_with_mocks(services_holder, {UserRole.USER})
 
 
-@pytest.fixture
-def app_with_mocked_services_rbac(services_mock: ServiceCollectionV3):
-    yield create_app_with_mocks(services_mock, external_auth=True)
+@pytest.fixture(scope="session")
+def app_with_mocked_services_rbac(services_holder: ServicesHolder):
+    yield create_app_with_mocks(services_holder, external_auth=True)
 
 
-@pytest.fixture
-def app_with_mocked_services_user_rbac(services_mock: ServiceCollectionV3):
+@pytest.fixture(scope="session")
+def app_with_mocked_services_user_rbac(services_holder: ServicesHolder):
     yield create_app_with_mocks(
-        services_mock, {UserRole.USER}, external_auth=True
+        services_holder, {UserRole.USER}, external_auth=True
     )
 
 
-@pytest.fixture
-def app_with_mocked_services_admin_rbac(services_mock: ServiceCollectionV3):
+@pytest.fixture(scope="session")
+def app_with_mocked_services_admin_rbac(services_holder: ServicesHolder):
     yield create_app_with_mocks(
-        services_mock, {UserRole.USER, UserRole.ADMIN}, external_auth=True
+        services_holder, {UserRole.USER, UserRole.ADMIN}, external_auth=True
     )
 
 
@@ -165,12 +174,17 @@ def internal_app_with_mocked_services(services_mock: ServiceCollectionV3):
     yield create_internal_app_with_mocks(services_mock)
 
 
+# The clients below also depend on `services_mock` so that the holder
+# carries a fresh mock for every test, even when the test itself never
+# requests the mock.
 @pytest.fixture
 async def mocked_api_client(
     app_with_mocked_services: FastAPI,
+    services_mock: ServiceCollectionV3,
 ) -> AsyncIterator[AsyncClient]:
     async with AsyncClient(
-        app=app_with_mocked_services, base_url="http://test"
+        transport=ASGITransport(app=app_with_mocked_services),
+        base_url="http://test",
     ) as client:
         yield client
 
@@ -180,7 +194,8 @@ async def mocked_internal_api_client(
     internal_app_with_mocked_services: FastAPI,
 ) -> AsyncIterator[AsyncClient]:
     async with AsyncClient(
-        app=internal_app_with_mocked_services, base_url="http://test"
+        transport=ASGITransport(app=internal_app_with_mocked_services),
+        base_url="http://test",
     ) as client:
         yield client
 
@@ -188,9 +203,11 @@ async def mocked_internal_api_client(
 @pytest.fixture
 async def mocked_api_client_user(
     app_with_mocked_services_user: FastAPI,
+    services_mock: ServiceCollectionV3,
 ) -> AsyncIterator[AsyncClient]:
     async with AsyncClient(
-        app=app_with_mocked_services_user, base_url="http://test"
+        transport=ASGITransport(app=app_with_mocked_services_user),
+        base_url="http://test",
     ) as client:
         yield client
 
@@ -198,9 +215,11 @@ async def mocked_api_client_user(
 @pytest.fixture
 async def mocked_api_client_admin(
     app_with_mocked_services_admin: FastAPI,
+    services_mock: ServiceCollectionV3,
 ) -> AsyncIterator[AsyncClient]:
     async with AsyncClient(
-        app=app_with_mocked_services_admin, base_url="http://test"
+        transport=ASGITransport(app=app_with_mocked_services_admin),
+        base_url="http://test",
     ) as client:
         yield client
 
@@ -208,9 +227,11 @@ async def mocked_api_client_admin(
 @pytest.fixture
 async def mocked_api_client_session_id(
     app_with_mocked_services_user: FastAPI,
+    services_mock: ServiceCollectionV3,
 ) -> AsyncIterator[AsyncClient]:
     async with AsyncClient(
-        app=app_with_mocked_services_user, base_url="http://test"
+        transport=ASGITransport(app=app_with_mocked_services_user),
+        base_url="http://test",
     ) as client:
         client.cookies.set("sessionid", "fakesessionid")
         yield client
@@ -219,9 +240,11 @@ async def mocked_api_client_session_id(
 @pytest.fixture
 async def mocked_api_client_rbac(
     app_with_mocked_services_rbac: FastAPI,
+    services_mock: ServiceCollectionV3,
 ) -> AsyncIterator[AsyncClient]:
     async with AsyncClient(
-        app=app_with_mocked_services_rbac, base_url="http://test"
+        transport=ASGITransport(app=app_with_mocked_services_rbac),
+        base_url="http://test",
     ) as client:
         yield client
 
@@ -229,9 +252,11 @@ async def mocked_api_client_rbac(
 @pytest.fixture
 async def mocked_api_client_user_rbac(
     app_with_mocked_services_user_rbac: FastAPI,
+    services_mock: ServiceCollectionV3,
 ) -> AsyncIterator[AsyncClient]:
     async with AsyncClient(
-        app=app_with_mocked_services_user_rbac, base_url="http://test"
+        transport=ASGITransport(app=app_with_mocked_services_user_rbac),
+        base_url="http://test",
     ) as client:
         yield client
 
@@ -239,9 +264,11 @@ async def mocked_api_client_user_rbac(
 @pytest.fixture
 async def mocked_api_client_admin_rbac(
     app_with_mocked_services_admin_rbac: FastAPI,
+    services_mock: ServiceCollectionV3,
 ) -> AsyncIterator[AsyncClient]:
     async with AsyncClient(
-        app=app_with_mocked_services_admin_rbac, base_url="http://test"
+        transport=ASGITransport(app=app_with_mocked_services_admin_rbac),
+        base_url="http://test",
     ) as client:
         yield client
 
@@ -261,7 +288,9 @@ async def api_app(
 @pytest.fixture
 async def api_client(api_app: FastAPI) -> AsyncIterator[AsyncClient]:
     """Client for the API."""
-    async with AsyncClient(app=api_app, base_url="http://test") as client:
+    async with AsyncClient(
+        transport=ASGITransport(app=api_app), base_url="http://test"
+    ) as client:
         yield client
 
 
@@ -318,7 +347,9 @@ async def authenticated_api_client(
     api_app: FastAPI, authenticated_user: User, user_session_id: str
 ) -> AsyncIterator[AsyncClient]:
     """Authenticated client for the API."""
-    async with AsyncClient(app=api_app, base_url="http://test") as client:
+    async with AsyncClient(
+        transport=ASGITransport(app=api_app), base_url="http://test"
+    ) as client:
         client.cookies.set("sessionid", user_session_id)
         yield client
 
@@ -330,7 +361,9 @@ async def authenticated_admin_api_client_v3(
     """Authenticated admin client for the V3 API."""
     params = {"is_superuser": True, "username": "admin"}
     created_user = await create_test_user(fixture, **params)
-    async with AsyncClient(app=api_app, base_url="http://test") as client:
+    async with AsyncClient(
+        transport=ASGITransport(app=api_app), base_url="http://test"
+    ) as client:
         response = await client.post(
             f"{V3_API_PREFIX}/auth/login",
             data={"username": created_user.username, "password": "test"},
@@ -349,7 +382,9 @@ async def authenticated_user_api_client_v3(
     """Authenticated user client for the V3 API."""
     params = {"is_superuser": False, "username": "user"}
     created_user = await create_test_user(fixture, **params)
-    async with AsyncClient(app=api_app, base_url="http://test") as client:
+    async with AsyncClient(
+        transport=ASGITransport(app=api_app), base_url="http://test"
+    ) as client:
         response = await client.post(
             f"{V3_API_PREFIX}/auth/login",
             data={"username": created_user.username, "password": "test"},
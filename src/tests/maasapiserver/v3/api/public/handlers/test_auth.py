@@ -99,6 +99,19 @@ TEST_PROVIDER_2 = OAuthProvider(
 )
 
 
+# Signing a token runs HMAC crypto; the tests below only need *a* valid
+# token, so sign one per module and share it.
+@pytest.fixture(scope="module")
+def signed_user_jwt() -> JWT:
+    return JWT.create("key", "username", 0, [UserRole.USER])
+
+
+# Likewise, base64-decode and parse the shared token's claims only once.
+@pytest.fixture(scope="module")
+def signed_user_claims(signed_user_jwt: JWT) -> dict:
+    return jwt.get_unverified_claims(signed_user_jwt.encoded)
+
+
 @pytest.mark.asyncio
 class TestAuthApi:
     BASE_PATH = f"{V3_API_PREFIX}/auth"
@@ -108,11 +121,11 @@ class TestAuthApi:
         self,
         services_mock: ServiceCollectionV3,
         mocked_api_client: AsyncClient,
+        signed_user_jwt: JWT,
+        signed_user_claims: dict,
     ) -> None:
         services_mock.auth = Mock(AuthService)
-        services_mock.auth.login.return_value = JWT.create(
-            "key", "username", 0, [UserRole.USER]
-        )
+        services_mock.auth.login.return_value = signed_user_jwt
         response = await mocked_api_client.post(
             f"{self.BASE_PATH}/login",
             data={"username": "username", "password": "test"},
@@ -121,10 +134,8 @@ class TestAuthApi:
 
         token_response = AccessTokenResponse(**response.json())
         assert token_response.token_type == "bearer"
-        assert (
-            jwt.get_unverified_claims(token_response.access_token)["sub"]
-            == "username"
-        )
+        assert token_response.access_token == signed_user_jwt.encoded
+        assert signed_user_claims["sub"] == "username"
 
     async def test_post_validation_failed(
         self,
@@ -194,11 +205,11 @@ class TestAuthApi:
         self,
         services_mock: ServiceCollectionV3,
         mocked_api_client_user: AsyncClient,
+        signed_user_jwt: JWT,
+        signed_user_claims: dict,
     ) -> None:
         services_mock.auth = Mock(AuthService)
-        services_mock.auth.access_token.return_value = JWT.create(
-            "key", "username", 0, [UserRole.USER]
-        )
+        services_mock.auth.access_token.return_value = signed_user_jwt
 
         response = await mocked_api_client_user.get(
             f"{self.BASE_PATH}/access_token",
@@ -208,19 +219,19 @@ class TestAuthApi:
         token_response = AccessTokenResponse(**response.json())
         assert token_response.kind == "AccessToken"
         assert token_response.token_type == "bearer"
-        decoded_token = jwt.get_unverified_claims(token_response.access_token)
-        assert decoded_token["sub"] == "username"
-        assert decoded_token["user_id"] == 0
+        assert token_response.access_token == signed_user_jwt.encoded
+        assert signed_user_claims["sub"] == "username"
+        assert signed_user_claims["user_id"] == 0
 
     async def test_get_access_token_with_session_id(
         self,
         services_mock: ServiceCollectionV3,
         mocked_api_client_session_id: AsyncClient,
+        signed_user_jwt: JWT,
+        signed_user_claims: dict,
     ) -> None:
         services_mock.auth = Mock(AuthService)
-        services_mock.auth.access_token.return_value = JWT.create(
-            "key", "username", 0, [UserRole.USER]
-        )
+        services_mock.auth.access_token.return_value = signed_user_jwt
         response = await mocked_api_client_session_id.get(
             f"{self.BASE_PATH}/access_token",
         )
@@ -229,9 +240,9 @@ class TestAuthApi:
         token_response = AccessTokenResponse(**response.json())
         assert token_response.kind == "AccessToken"
         assert token_response.token_type == "bearer"
-        decoded_token = jwt.get_unverified_claims(token_response.access_token)
-        assert decoded_token["sub"] == "username"
-        assert decoded_token["user_id"] == 0
+        assert token_response.access_token == signed_user_jwt.encoded
+        assert signed_user_claims["sub"] == "username"
+        assert signed_user_claims["user_id"] == 0
 
     @pytest.mark.skip
     async def test_get_access_token_with_macaroon(self):
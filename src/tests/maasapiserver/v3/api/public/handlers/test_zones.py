@@ -52,6 +52,14 @@ TEST_ZONE = Zone(
     created=utcnow(),
     updated=utcnow(),
 )
+# These request payloads are static, so encode them once at import time
+# instead of re-running jsonable_encoder in every test.
+UPDATE_ZONE_REQUEST_JSON = jsonable_encoder(
+    ZoneRequest(name="new_name", description="new_description")
+)
+MYZONE_REQUEST_JSON = jsonable_encoder(
+    ZoneRequest(name="myzone", description=None)
+)
 
 
 class TestZonesApi(ApiCommonTests):
@@ -85,7 +93,7 @@ class TestZonesApi(ApiCommonTests):
         )
         response = await mocked_api_client_user.get(f"{self.BASE_PATH}?size=1")
         assert response.status_code == 200
-        zones_response = ZonesListResponse(**response.json())
+        zones_response = ZonesListResponse.parse_raw(response.content)
         assert len(zones_response.items) == 1
         assert zones_response.total == 2
         assert zones_response.next == f"{self.BASE_PATH}?page=2&size=1"
@@ -101,7 +109,7 @@ class TestZonesApi(ApiCommonTests):
         )
         response = await mocked_api_client_user.get(f"{self.BASE_PATH}?size=2")
         assert response.status_code == 200
-        zones_response = ZonesListResponse(**response.json())
+        zones_response = ZonesListResponse.parse_raw(response.content)
         assert len(zones_response.items) == 2
         assert zones_response.total == 2
         assert zones_response.next is None
@@ -127,8 +135,8 @@ class TestZonesApi(ApiCommonTests):
             f"{V3_API_PREFIX}/zones_with_summary?size=1"
         )
         assert response.status_code == 200
-        zones_with_summary_response = ZonesWithSummaryListResponse(
-            **response.json()
+        zones_with_summary_response = ZonesWithSummaryListResponse.parse_raw(
+            response.content
         )
         assert len(zones_with_summary_response.items) == 1
         assert zones_with_summary_response.total == 1
@@ -165,8 +173,8 @@ class TestZonesApi(ApiCommonTests):
             f"{V3_API_PREFIX}/zones_with_summary?size=1"
         )
         assert response.status_code == 200
-        zones_with_summary_response = ZonesWithSummaryListResponse(
-            **response.json()
+        zones_with_summary_response = ZonesWithSummaryListResponse.parse_raw(
+            response.content
         )
         assert len(zones_with_summary_response.items) == 1
         assert zones_with_summary_response.total == 2
@@ -191,7 +199,7 @@ class TestZonesApi(ApiCommonTests):
             f"{self.BASE_PATH}?id=1&id=4&size=1"
         )
         assert response.status_code == 200
-        zones_response = ZonesListResponse(**response.json())
+        zones_response = ZonesListResponse.parse_raw(response.content)
         assert len(zones_response.items) == 1
 
         assert zones_response.next is not None
@@ -215,7 +223,7 @@ class TestZonesApi(ApiCommonTests):
         response = await mocked_api_client_user.get(self.DEFAULT_ZONE_PATH)
         assert response.status_code == 200
         assert len(response.headers["ETag"]) > 0
-        zone_response = ZoneResponse(**response.json())
+        zone_response = ZoneResponse.parse_raw(response.content)
         assert zone_response.id == 1
         assert zone_response.name == DEFAULT_ZONE_NAME
 
@@ -230,7 +238,7 @@ class TestZonesApi(ApiCommonTests):
         assert response.status_code == 404
         assert "ETag" not in response.headers
 
-        error_response = ErrorBodyResponse(**response.json())
+        error_response = ErrorBodyResponse.parse_raw(response.content)
         assert error_response.kind == "Error"
         assert error_response.code == 404
 
@@ -247,7 +255,7 @@ class TestZonesApi(ApiCommonTests):
         assert response.status_code == 422
         assert "ETag" not in response.headers
 
-        error_response = ErrorBodyResponse(**response.json())
+        error_response = ErrorBodyResponse.parse_raw(response.content)
         assert error_response.kind == "Error"
         assert error_response.code == 422
 
@@ -261,22 +269,18 @@ class TestZonesApi(ApiCommonTests):
         updated_test_zone.name = "new_name"
         updated_test_zone.description = "new_description"
 
-        update_zone_request = ZoneRequest(
-            name="new_name",
-            description="new_description",
-        )
         services_mock.zones = Mock(ZonesService)
         services_mock.zones.update_by_id.return_value = updated_test_zone
 
         response = await mocked_api_client_admin.put(
             f"{self.BASE_PATH}/{str(TEST_ZONE.id)}",
-            json=jsonable_encoder(update_zone_request),
+            json=UPDATE_ZONE_REQUEST_JSON,
         )
 
         assert response.status_code == 200
         assert len(response.headers["ETag"]) > 0
 
-        updated_zone_response = ZoneResponse(**response.json())
+        updated_zone_response = ZoneResponse.parse_raw(response.content)
 
         assert updated_zone_response.id == updated_test_zone.id
         assert updated_zone_response.name == updated_test_zone.name
@@ -292,20 +296,15 @@ class TestZonesApi(ApiCommonTests):
         services_mock.zones = Mock(ZonesService)
         services_mock.zones.update_by_id.return_value = None
 
-        update_zone_request = ZoneRequest(
-            name="new_name",
-            description="new_description",
-        )
-
         response = await mocked_api_client_admin.put(
             f"{self.BASE_PATH}/99",
-            json=jsonable_encoder(update_zone_request),
+            json=UPDATE_ZONE_REQUEST_JSON,
         )
 
         assert response.status_code == 404
         assert "ETag" not in response.headers
 
-        error_response = ErrorBodyResponse(**response.json())
+        error_response = ErrorBodyResponse.parse_raw(response.content)
 
         assert error_response.kind == "Error"
         assert error_response.code == 404
@@ -318,20 +317,15 @@ class TestZonesApi(ApiCommonTests):
         services_mock.zones = Mock(ZonesService)
         services_mock.zones.update_by_id.return_value = None
 
-        update_zone_request = ZoneRequest(
-            name="new_name",
-            description="new_description",
-        )
-
         response = await mocked_api_client_admin.put(
             f"{self.BASE_PATH}/xyz",
-            json=jsonable_encoder(update_zone_request),
+            json=UPDATE_ZONE_REQUEST_JSON,
         )
 
         assert response.status_code == 422
         assert "ETag" not in response.headers
 
-        error_response = ErrorBodyResponse(**response.json())
+        error_response = ErrorBodyResponse.parse_raw(response.content)
 
         assert error_response.kind == "Error"
         assert error_response.code == 422
@@ -352,7 +346,7 @@ class TestZonesApi(ApiCommonTests):
         )
         assert response.status_code == 201
         assert len(response.headers["ETag"]) > 0
-        zone_response = ZoneResponse(**response.json())
+        zone_response = ZoneResponse.parse_raw(response.content)
         assert zone_response.id > 1
         assert zone_response.name == zone_request.name
         assert zone_response.description == zone_request.description
@@ -366,7 +360,6 @@ class TestZonesApi(ApiCommonTests):
         services_mock: ServiceCollectionV3,
         mocked_api_client_admin: AsyncClient,
     ) -> None:
-        zone_request = ZoneRequest(name="myzone", description=None)
         services_mock.zones = Mock(ZonesService)
         services_mock.zones.create.return_value = Zone(
             id=2,
@@ -376,10 +369,10 @@ class TestZonesApi(ApiCommonTests):
             updated=utcnow(),
         )
         response = await mocked_api_client_admin.post(
-            self.BASE_PATH, json=jsonable_encoder(zone_request)
+            self.BASE_PATH, json=MYZONE_REQUEST_JSON
         )
         assert response.status_code == 201
-        zone_response = ZoneResponse(**response.json())
+        zone_response = ZoneResponse.parse_raw(response.content)
         assert zone_response.description == ""
 
     async def test_post_409(
@@ -387,7 +380,6 @@ class TestZonesApi(ApiCommonTests):
         services_mock: ServiceCollectionV3,
         mocked_api_client_admin: AsyncClient,
     ) -> None:
-        zone_request = ZoneRequest(name="myzone", description=None)
         services_mock.zones = Mock(ZonesService)
         services_mock.zones.create.side_effect = [
             TEST_ZONE,
@@ -401,16 +393,16 @@ class TestZonesApi(ApiCommonTests):
             ),
         ]
         response = await mocked_api_client_admin.post(
-            self.BASE_PATH, json=jsonable_encoder(zone_request)
+            self.BASE_PATH, json=MYZONE_REQUEST_JSON
         )
         assert response.status_code == 201
 
         response = await mocked_api_client_admin.post(
-            self.BASE_PATH, json=jsonable_encoder(zone_request)
+            self.BASE_PATH, json=MYZONE_REQUEST_JSON
         )
         assert response.status_code == 409
 
-        error_response = ErrorBodyResponse(**response.json())
+        error_response = ErrorBodyResponse.parse_raw(response.content)
         assert error_response.kind == "Error"
         assert error_response.code == 409
         assert len(error_response.details) == 1
@@ -440,7 +432,7 @@ class TestZonesApi(ApiCommonTests):
         )
         assert response.status_code == 422
 
-        error_response = ErrorBodyResponse(**response.json())
+        error_response = ErrorBodyResponse.parse_raw(response.content)
         assert error_response.kind == "Error"
         assert error_response.code == 422
 
@@ -462,7 +454,7 @@ class TestZonesApi(ApiCommonTests):
 
         response = await mocked_api_client_admin.delete(self.DEFAULT_ZONE_PATH)
 
-        error_response = ErrorBodyResponse(**response.json())
+        error_response = ErrorBodyResponse.parse_raw(response.content)
         assert response.status_code == 400
         assert error_response.code == 400
         assert error_response.message == "Bad request."
@@ -506,7 +498,7 @@ class TestZonesApi(ApiCommonTests):
             headers={"if-match": "wrong_etag"},
         )
         assert failed_response.status_code == 412
-        error_response = ErrorBodyResponse(**failed_response.json())
+        error_response = ErrorBodyResponse.parse_raw(failed_response.content)
         assert error_response.code == 412
         assert error_response.message == "A precondition has failed."
         assert (
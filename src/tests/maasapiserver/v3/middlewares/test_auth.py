@@ -6,7 +6,7 @@ from typing import Any, AsyncIterator, Callable, Iterator
 from unittest.mock import AsyncMock, Mock
 
 from fastapi import FastAPI, Request
-from httpx import AsyncClient
+from httpx import ASGITransport, AsyncClient
 from macaroonbakery import bakery, checkers
 from macaroonbakery.bakery import (
     DischargeRequiredError,
@@ -94,6 +94,33 @@ from tests.fixtures.factories.user import (
 )
 from tests.maasapiserver.fixtures.db import Fixture
 
+# How far in the past an external-auth check has to be before the
+# providers re-validate the user against Candid/RBAC.
+_LAST_CHECK_OFFSET = EXTERNAL_USER_CHECK_INTERVAL + timedelta(minutes=10)
+
+
+def _rbac_pool_permissions(
+    view_resources: list[str],
+) -> tuple[PermissionResourcesMapping, ...]:
+    """The RBAC validation tests only ever vary the VIEW resources.
+
+    The provider only iterates the mappings, so a tuple is enough.
+    """
+    return (
+        PermissionResourcesMapping(
+            permission=RbacPermission.VIEW, resources=view_resources
+        ),
+        PermissionResourcesMapping(
+            permission=RbacPermission.VIEW_ALL, resources=[]
+        ),
+        PermissionResourcesMapping(
+            permission=RbacPermission.DEPLOY_MACHINES, resources=[]
+        ),
+        PermissionResourcesMapping(
+            permission=RbacPermission.ADMIN_MACHINES, resources=[]
+        ),
+    )
+
 
 def _make_user(is_superuser: bool = False) -> User:
     return User(
@@ -124,23 +151,31 @@ def _make_oidc_user(is_superuser: bool = False) -> User:
     )
 
 
+# The providers are stateless, so one cache can serve every test while
+# the app itself stays function-scoped around db_connection.
+@pytest.fixture(scope="session")
+def auth_providers_cache() -> AuthenticationProvidersCache:
+    return AuthenticationProvidersCache(
+        jwt_authentication_providers=[LocalAuthenticationProvider()],
+        session_authentication_provider=DjangoSessionAuthenticationProvider(),
+        macaroon_authentication_provider=MacaroonAuthenticationProvider(),
+        oidc_authentication_provider=OIDCAuthenticationProvider(),
+    )
+
+
 @pytest.fixture
 def auth_app(
     db: Database,
     db_connection: AsyncConnection,
     transaction_middleware_class: type,
+    auth_providers_cache: AuthenticationProvidersCache,
 ) -> Iterator[FastAPI]:
     app = FastAPI()
     services_cache = CacheForServices()
 
     app.add_middleware(
         V3AuthenticationMiddleware,
-        providers_cache=AuthenticationProvidersCache(
-            jwt_authentication_providers=[LocalAuthenticationProvider()],
-            session_authentication_provider=DjangoSessionAuthenticationProvider(),
-            macaroon_authentication_provider=MacaroonAuthenticationProvider(),
-            oidc_authentication_provider=OIDCAuthenticationProvider(),
-        ),
+        providers_cache=auth_providers_cache,
     )
     app.add_middleware(ServicesMiddleware, cache=services_cache)
     app.add_middleware(transaction_middleware_class, db=db)
@@ -189,7 +224,9 @@ def auth_app(
 
 @pytest.fixture
 async def auth_client(auth_app: FastAPI) -> AsyncIterator[AsyncClient]:
-    async with AsyncClient(app=auth_app, base_url="http://test") as client:
+    async with AsyncClient(
+        transport=ASGITransport(app=auth_app), base_url="http://test"
+    ) as client:
         yield client
 
 
@@ -654,12 +691,13 @@ class TestMacaroonAuthenticationProvider:
         )
 
     def _check_macaroons(self, macaroons: list[list[Macaroon]]):
-        assert len(macaroons) == 1
-        assert len(macaroons[0]) == 2
-        assert macaroons[0][0].location == "http://localhost:5240/"
-        assert macaroons[0][1].location == ""
-        assert macaroons[0][0].version == 1
-        assert macaroons[0][1].version == 1
+        [(first, second)] = macaroons
+        assert (
+            first.location,
+            second.location,
+            first.version,
+            second.version,
+        ) == ("http://localhost:5240/", "", 1, 1)
 
     async def test_extract_macaroons(self) -> None:
         request = self.mock_request()
@@ -707,9 +745,18 @@ class TestValidateUserExternalAuthCandid:
             AsyncMock(return_value=self.client)
         )
         self.provider = MacaroonAuthenticationProvider()
-        self.default_last_check = (
-            utcnow() - EXTERNAL_USER_CHECK_INTERVAL - timedelta(minutes=10)
+        self.default_last_check = utcnow() - _LAST_CHECK_OFFSET
+
+    # Most tests start from a user whose last external-auth check is
+    # older than EXTERNAL_USER_CHECK_INTERVAL; create that pair of rows in
+    # one place.  Depends on `prepare` for self.default_last_check.
+    @pytest.fixture
+    async def expired_check_user(self, fixture: Fixture, prepare) -> User:
+        user = await create_test_user(fixture)
+        await create_test_user_profile(
+            fixture, user.id, auth_last_check=self.default_last_check
         )
+        return user
 
     async def test_interval_not_expired(self, fixture: Fixture):
         user = await create_test_user(fixture)
@@ -722,18 +769,36 @@ class TestValidateUserExternalAuthCandid:
         assert validated_user is not None
         self.client.get_groups.assert_not_called()
 
-    async def test_valid_user_check(self, fixture: Fixture):
-        user = await create_test_user(fixture)
-        extra_details = {"auth_last_check": self.default_last_check}
-        await create_test_user_profile(fixture, user.id, **extra_details)
-        self.client.get_groups.return_value = GetGroupsResponse(
-            groups=["group1", "group2"]
-        )
+    @pytest.mark.parametrize(
+        ("groups", "expected_superuser", "user_details"),
+        [
+            pytest.param(["group1", "group2"], False, {}, id="user"),
+            pytest.param(["group1", "group2", "admin"], True, {}, id="admin"),
+            pytest.param(
+                ["group1", "group2"],
+                False,
+                {"is_active": False},
+                id="inactive",
+            ),
+        ],
+    )
+    async def test_valid_user_check(
+        self,
+        fixture: Fixture,
+        groups: list[str],
+        expected_superuser: bool,
+        user_details: dict,
+    ):
+        user = await create_test_user(fixture, **user_details)
+        await create_test_user_profile(
+            fixture, user.id, auth_last_check=self.default_last_check
+        )
+        self.client.get_groups.return_value = GetGroupsResponse(groups=groups)
         validated_user = await self.provider.validate_user_external_auth(
             self.request, user
         )
         assert validated_user is not None
-        assert validated_user.is_superuser is False
+        assert validated_user.is_superuser is expected_superuser
         assert validated_user.is_active is True
         assert validated_user.email == "myusername@candid.example.com"
         user_profile_updated = (
@@ -742,74 +807,24 @@ class TestValidateUserExternalAuthCandid:
             )
         )
         assert user_profile_updated.auth_last_check > self.default_last_check
-        self.client.get_groups.assert_called_once_with(validated_user.username)
-        self.client.get_user_details.assert_called_once_with(
-            validated_user.username
-        )
-
-    async def test_valid_user_check_admin(self, fixture: Fixture):
-        user = await create_test_user(fixture)
-        extra_details = {"auth_last_check": self.default_last_check}
-        await create_test_user_profile(fixture, user.id, **extra_details)
-
-        self.client.get_groups.return_value = GetGroupsResponse(
-            groups=["group1", "group2", "admin"]
-        )
-        validated_user = await self.provider.validate_user_external_auth(
-            self.request, user
-        )
-        assert validated_user is not None
-        assert validated_user.is_superuser is True
-        assert validated_user.is_active is True
-        assert validated_user.email == "myusername@candid.example.com"
         self.client.get_groups.assert_called_once_with(user.username)
         self.client.get_user_details.assert_called_once_with(user.username)
 
-    async def test_system_user_valid_no_check(self, fixture: Fixture):
-        extra_details = {"username": WORKER_USERNAME}
-        user = await create_test_user(fixture, **extra_details)
-        validated_user = await self.provider.validate_user_external_auth(
-            self.request, user
-        )
-        assert validated_user is not None
-        self.client.get_groups.assert_not_called()
-
-        extra_details = {"username": NODE_INIT_USERNAME}
-        user = await create_test_user(fixture, **extra_details)
+    @pytest.mark.parametrize("username", [WORKER_USERNAME, NODE_INIT_USERNAME])
+    async def test_system_user_valid_no_check(
+        self, fixture: Fixture, username: str
+    ):
+        user = await create_test_user(fixture, username=username)
         validated_user = await self.provider.validate_user_external_auth(
             self.request, user
         )
         assert validated_user is not None
         self.client.get_groups.assert_not_called()
 
-    async def test_valid_inactive_user_is_active(self, fixture: Fixture):
-        extra_details = {"is_active": False}
-        user = await create_test_user(fixture, **extra_details)
-        extra_details = {"auth_last_check": self.default_last_check}
-        await create_test_user_profile(fixture, user.id, **extra_details)
-        self.client.get_groups.return_value = GetGroupsResponse(
-            groups=["group1", "group2"]
-        )
-        validated_user = await self.provider.validate_user_external_auth(
-            self.request, user
-        )
-        assert validated_user is not None
-        assert validated_user.is_superuser is False
-        assert validated_user.is_active is True
-        assert validated_user.email == "myusername@candid.example.com"
-        user_profile_updated = (
-            await self.request.state.services.users.get_user_profile(
-                validated_user.username
-            )
-        )
-        assert user_profile_updated.auth_last_check > self.default_last_check
-        self.client.get_groups.assert_called_once_with(user.username)
-        self.client.get_user_details.assert_called_once_with(user.username)
-
-    async def test_invalid_user_check(self, fixture: Fixture):
-        user = await create_test_user(fixture)
-        extra_details = {"auth_last_check": self.default_last_check}
-        await create_test_user_profile(fixture, user.id, **extra_details)
+    async def test_invalid_user_check(
+        self, fixture: Fixture, expired_check_user: User
+    ):
+        user = expired_check_user
         self.client.get_groups.side_effect = MacaroonApiException(
             404, "user not found"
         )
@@ -846,9 +861,18 @@ class TestValidateUserExternalAuthRbac:
             return_value=self.client
         )
         self.provider = MacaroonAuthenticationProvider()
-        self.default_last_check = (
-            utcnow() - EXTERNAL_USER_CHECK_INTERVAL - timedelta(minutes=10)
+        self.default_last_check = utcnow() - _LAST_CHECK_OFFSET
+
+    # Most tests start from a user whose last external-auth check is
+    # older than EXTERNAL_USER_CHECK_INTERVAL; create that pair of rows in
+    # one place.  Depends on `prepare` for self.default_last_check.
+    @pytest.fixture
+    async def expired_check_user(self, fixture: Fixture, prepare) -> User:
+        user = await create_test_user(fixture)
+        await create_test_user_profile(
+            fixture, user.id, auth_last_check=self.default_last_check
         )
+        return user
 
     async def test_interval_not_expired(self, fixture: Fixture):
         user = await create_test_user(fixture)
@@ -861,137 +885,71 @@ class TestValidateUserExternalAuthRbac:
         assert validated_user is not None
         self.client.allowed_for_user.assert_not_called()
 
-    async def test_valid_user_check_has_pools_access(self, fixture: Fixture):
-        user = await create_test_user(fixture)
-        extra_details = {"auth_last_check": self.default_last_check}
-        await create_test_user_profile(fixture, user.id, **extra_details)
-        # not an admin, but has permission on pools
-        self.client.is_user_admin.return_value = False
-        self.client.get_resource_pool_ids.return_value = [
-            PermissionResourcesMapping(
-                permission=RbacPermission.VIEW, resources=["1", "2"]
-            ),
-            PermissionResourcesMapping(
-                permission=RbacPermission.VIEW_ALL, resources=[]
-            ),
-            PermissionResourcesMapping(
-                permission=RbacPermission.DEPLOY_MACHINES, resources=[]
+    @pytest.mark.parametrize(
+        (
+            "is_admin",
+            "view_resources",
+            "expected_active",
+            "expected_superuser",
+            "user_details",
+        ),
+        [
+            # not an admin, but has permission on pools
+            pytest.param(
+                False, ["1", "2"], True, False, {}, id="pools-access"
             ),
-            PermissionResourcesMapping(
-                permission=RbacPermission.ADMIN_MACHINES, resources=[]
+            # admin, but no permissions on pools
+            pytest.param(True, [], True, True, {}, id="admin-access"),
+            pytest.param(False, [], False, False, {}, id="no-permission"),
+            # an inactive user with pool access gets re-activated
+            pytest.param(
+                False,
+                ["1", "2"],
+                True,
+                False,
+                {"is_active": False},
+                id="inactive",
             ),
-        ]
-        validated_user = await self.provider.validate_user_external_auth(
-            self.request, user
+        ],
+    )
+    async def test_valid_user_check(
+        self,
+        fixture: Fixture,
+        is_admin: bool,
+        view_resources: list[str],
+        expected_active: bool,
+        expected_superuser: bool,
+        user_details: dict,
+    ):
+        user = await create_test_user(fixture, **user_details)
+        await create_test_user_profile(
+            fixture, user.id, auth_last_check=self.default_last_check
+        )
+        self.client.is_user_admin.return_value = is_admin
+        self.client.get_resource_pool_ids.return_value = (
+            _rbac_pool_permissions(view_resources)
         )
-        assert validated_user is not None
-        assert validated_user.is_active is True
-        assert validated_user.is_superuser is False
-        assert validated_user.email == "myusername@rbac.example.com"
-
-    async def test_valid_user_check_has_admin_access(self, fixture: Fixture):
-        user = await create_test_user(fixture)
-        extra_details = {"auth_last_check": self.default_last_check}
-        await create_test_user_profile(fixture, user.id, **extra_details)
-        # admin, but no permissions on pools
-        self.client.is_user_admin.return_value = True
-
-        self.client.get_resource_pool_ids.return_value = [
-            PermissionResourcesMapping(
-                permission=RbacPermission.VIEW, resources=[]
-            ),
-            PermissionResourcesMapping(
-                permission=RbacPermission.VIEW_ALL, resources=[]
-            ),
-            PermissionResourcesMapping(
-                permission=RbacPermission.DEPLOY_MACHINES, resources=[]
-            ),
-            PermissionResourcesMapping(
-                permission=RbacPermission.ADMIN_MACHINES, resources=[]
-            ),
-        ]
         validated_user = await self.provider.validate_user_external_auth(
             self.request, user
         )
         assert validated_user is not None
-        assert validated_user.is_active is True
-        assert validated_user.is_superuser is True
+        assert validated_user.is_active is expected_active
+        assert validated_user.is_superuser is expected_superuser
         assert validated_user.email == "myusername@rbac.example.com"
 
-    async def test_valid_user_no_permission(self, fixture: Fixture):
-        user = await create_test_user(fixture)
-        extra_details = {"auth_last_check": self.default_last_check}
-        await create_test_user_profile(fixture, user.id, **extra_details)
-        self.client.is_user_admin.return_value = False
-        self.client.get_resource_pool_ids.return_value = [
-            PermissionResourcesMapping(
-                permission=RbacPermission.VIEW, resources=[]
-            ),
-            PermissionResourcesMapping(
-                permission=RbacPermission.VIEW_ALL, resources=[]
-            ),
-            PermissionResourcesMapping(
-                permission=RbacPermission.DEPLOY_MACHINES, resources=[]
-            ),
-            PermissionResourcesMapping(
-                permission=RbacPermission.ADMIN_MACHINES, resources=[]
-            ),
-        ]
-        validated_user = await self.provider.validate_user_external_auth(
-            self.request, user
-        )
-        assert validated_user is not None
-        assert validated_user.is_active is False
-        assert validated_user.is_superuser is False
-        assert validated_user.email == "myusername@rbac.example.com"
-
-    async def test_system_user_valid_no_check(self, fixture: Fixture):
-        extra_details = {"username": "MAAS"}
-        user = await create_test_user(fixture, **extra_details)
+    @pytest.mark.parametrize("username", [WORKER_USERNAME, NODE_INIT_USERNAME])
+    async def test_system_user_valid_no_check(
+        self, fixture: Fixture, username: str
+    ):
+        user = await create_test_user(fixture, username=username)
         validated_user = await self.provider.validate_user_external_auth(
             self.request, user
         )
         assert validated_user is not None
         self.client.allowed_for_user.assert_not_called()
 
-        extra_details = {"username": "maas-init-node"}
-        user = await create_test_user(fixture, **extra_details)
-        validated_user = await self.provider.validate_user_external_auth(
-            self.request, user
-        )
-        assert validated_user is not None
-        self.client.allowed_for_user.assert_not_called()
-
-    async def test_valid_inactive_user_is_active(self, fixture: Fixture):
-        extra_details = {"is_active": False}
-        user = await create_test_user(fixture)
-        extra_details = {"auth_last_check": self.default_last_check}
-        await create_test_user_profile(fixture, user.id, **extra_details)
-        self.client.is_user_admin.return_value = False
-        self.client.get_resource_pool_ids.return_value = [
-            PermissionResourcesMapping(
-                permission=RbacPermission.VIEW, resources=["1", "2"]
-            ),
-            PermissionResourcesMapping(
-                permission=RbacPermission.VIEW_ALL, resources=[]
-            ),
-            PermissionResourcesMapping(
-                permission=RbacPermission.DEPLOY_MACHINES, resources=[]
-            ),
-            PermissionResourcesMapping(
-                permission=RbacPermission.ADMIN_MACHINES, resources=[]
-            ),
-        ]
-        validated_user = await self.provider.validate_user_external_auth(
-            self.request, user
-        )
-        assert validated_user is not None
-        assert validated_user.is_active is True
-
-    async def test_failed_permission_check(self, fixture: Fixture):
-        user = await create_test_user(fixture)
-        extra_details = {"auth_last_check": self.default_last_check}
-        await create_test_user_profile(fixture, user.id, **extra_details)
+    async def test_failed_permission_check(self, expired_check_user: User):
+        user = expired_check_user
         self.client.is_user_admin.side_effect = MacaroonApiException(
             500, "fail!"
         )
@@ -1001,10 +959,8 @@ class TestValidateUserExternalAuthRbac:
         assert validated_user is None
         self.client.is_user_admin.assert_called_once_with(user.username)
 
-    async def test_failed_user_details_check(self, fixture: Fixture):
-        user = await create_test_user(fixture)
-        extra_details = {"auth_last_check": self.default_last_check}
-        await create_test_user_profile(fixture, user.id, **extra_details)
+    async def test_failed_user_details_check(self, expired_check_user: User):
+        user = expired_check_user
         self.client.get_user_details.side_effect = MacaroonApiException(
             500, "fail!"
         )
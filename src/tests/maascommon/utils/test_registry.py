@@ -72,6 +72,24 @@ class TestRegistry:
         with pytest.raises(KeyError):
             Registry.register_item("resource", sentinel.resource)
 
+    def test_register_items(self):
+        Registry.register_items(
+            {"resource1": sentinel.resource1, "resource2": sentinel.resource2}
+        )
+        assert [
+            ("resource1", sentinel.resource1),
+            ("resource2", sentinel.resource2),
+        ] == list(Registry)
+
+    def test_register_items_duplicate_key(self):
+        Registry.register_item("resource", sentinel.resource)
+        with pytest.raises(KeyError):
+            Registry.register_items(
+                {"resource": sentinel.other, "other": sentinel.other}
+            )
+        # Nothing from the rejected mapping was registered.
+        assert "other" not in Registry
+
     def test_registered_items_are_stored_separately_by_registry(self):
         class RegistryOne(Registry):
             """A registry distinct from the base `Registry`."""
@@ -20,8 +20,13 @@ from maasserver.models import (
 )
 from maasserver.models.largefile import LargeFile
 from maasserver.utils.orm import reload_object
+from maastesting.factory import factory as maastesting_factory
 from provisioningserver.config import ClusterConfiguration
 
+# Digests of the fixed payloads used below, hashed once at import.
+SHA256_UBUNTU_JAMMY = sha256(b"ubuntu-jammy").hexdigest()
+SHA256_CENTOS_8 = sha256(b"centos-8").hexdigest()
+
 
 @pytest.fixture
 def controller(factory, mocker):
@@ -57,11 +62,33 @@ def tftp_root(mocker, maas_data_dir, tmpdir):
     shutil.rmtree(tftp_root)
 
 
+@pytest.fixture(scope="session")
+def bootloader_tarball(tmp_path_factory) -> bytes:
+    """The bytes of the bootloader tarball used by the export tests.
+
+    Both tests archive the same two files, so build the tarball once per
+    session instead of shelling out to tar in each test.
+    """
+    tarball = maastesting_factory.make_tarball(
+        tmp_path_factory.mktemp("bootloader"),
+        {
+            "grubx64.efi": b"grub content",
+            "bootx64.efi": b"boot content",
+        },
+    )
+    return Path(tarball).read_bytes()
+
+
 def list_files(base_path):
-    return {str(path.relative_to(base_path)) for path in base_path.iterdir()}
+    # scandir yields names straight from the readdir buffer, without a
+    # Path object and relative_to computation per entry.
+    with os.scandir(base_path) as entries:
+        return {entry.name for entry in entries}
 
 
-def make_LargeFile(factory, content: bytes = None, size=None):
+def make_LargeFile(
+    factory, content: bytes = None, size=None, digest: str | None = None
+):
     if content is None:
         content_size = size
         if content_size is None:
@@ -69,9 +96,8 @@ def make_LargeFile(factory, content: bytes = None, size=None):
         content = factory.make_bytes(size=content_size)
     if size is None:
         size = len(content)
-    sha256 = hashlib.sha256()
-    sha256.update(content)
-    digest = sha256.hexdigest()
+    if digest is None:
+        digest = hashlib.sha256(content).hexdigest()
     largeobject = LargeObjectFile()
     with largeobject.open("wb") as stream:
         stream.write(content)
@@ -92,8 +118,11 @@ def make_boot_resource_file_with_content_largefile(
     content: bytes | None = None,
     size: int | None = None,
     regions: list[RegionController] | None = None,
+    digest: str | None = None,
 ) -> BootResourceFile:
-    largefile = make_LargeFile(factory, content=content, size=size)
+    largefile = make_LargeFile(
+        factory, content=content, size=size, digest=digest
+    )
     return factory.make_BootResourceFile(
         resource_set,
         filename=filename,
@@ -121,12 +150,12 @@ class TestExportImagesFromDB:
             version="20230901",
             label="stable",
         )
-        content1 = b"ubuntu-jammy"
         make_boot_resource_file_with_content_largefile(
             factory,
             resource_set=resource_set1,
             filename="boot-initrd",
-            content=content1,
+            content=b"ubuntu-jammy",
+            digest=SHA256_UBUNTU_JAMMY,
         )
 
         resource2 = factory.make_BootResource(
@@ -138,24 +167,24 @@ class TestExportImagesFromDB:
             version="20230830",
             label="candidate",
         )
-        content2 = b"centos-8"
         make_boot_resource_file_with_content_largefile(
             factory,
             resource_set=resource_set2,
             filename="boot-kernel",
-            content=content2,
+            content=b"centos-8",
+            digest=SHA256_CENTOS_8,
         )
         export_images_from_db(controller, image_store_dir)
         assert list_files(image_store_dir) == {
-            sha256(content1).hexdigest()[:7],
-            sha256(content2).hexdigest()[:7],
+            SHA256_UBUNTU_JAMMY[:7],
+            SHA256_CENTOS_8[:7],
         }
 
     def test_export_overwrite_changed(
         self, controller, image_store_dir, factory
     ):
         content = b"ubuntu-jammy"
-        image = image_store_dir / sha256(content).hexdigest()[:7]
+        image = image_store_dir / SHA256_UBUNTU_JAMMY[:7]
         image.write_bytes(b"old")
 
         resource = factory.make_BootResource(
@@ -172,6 +201,7 @@ class TestExportImagesFromDB:
             resource_set=resource_set,
             filename="boot-initrd",
             content=content,
+            digest=SHA256_UBUNTU_JAMMY,
         )
         export_images_from_db(controller, image_store_dir)
         assert image.read_bytes() == content
@@ -198,7 +228,9 @@ class TestExportImagesFromDB:
         assert reload_object(largefile) is None
         # largeobject also gets deleted
         with connection.cursor() as cursor:
-            cursor.execute("SELECT loid FROM pg_largeobject")
+            # pg_largeobject_metadata has one row per large object, unlike
+            # pg_largeobject which has one per page and needs a dedup scan.
+            cursor.execute("SELECT oid FROM pg_largeobject_metadata")
             assert cursor.fetchall() == []
 
     def test_partial_largfile(self, controller, image_store_dir, factory):
@@ -226,7 +258,9 @@ class TestExportImagesFromDB:
         assert reload_object(largefile) is None
         # largeobject also gets deleted
         with connection.cursor() as cursor:
-            cursor.execute("SELECT loid FROM pg_largeobject")
+            # pg_largeobject_metadata has one row per large object, unlike
+            # pg_largeobject which has one per page and needs a dedup scan.
+            cursor.execute("SELECT oid FROM pg_largeobject_metadata")
             assert cursor.fetchall() == []
 
     def test_no_largefile_ignore(self, controller, image_store_dir, factory):
@@ -322,7 +356,7 @@ class TestInitialiseImageStorage:
         assert other.get_latest_complete_set() is not None
 
     def test_booloaders_export(
-        self, controller, tmpdir, image_store_dir, factory, mocker
+        self, controller, image_store_dir, factory, mocker, bootloader_tarball
     ):
         mocker.patch("maasserver.utils.orm.post_commit_hooks")
         mocker.patch("maasserver.utils.orm.post_commit_do")
@@ -337,21 +371,12 @@ class TestInitialiseImageStorage:
             version="20230901",
             label="stable",
         )
-        tarball = Path(
-            factory.make_tarball(
-                tmpdir,
-                {
-                    "grubx64.efi": b"grub content",
-                    "bootx64.efi": b"boot content",
-                },
-            )
-        )
         make_boot_resource_file_with_content_largefile(
             factory,
             resource_set=resource_set,
             filetype=BOOT_RESOURCE_FILE_TYPE.ARCHIVE_TAR_XZ,
             filename="grub2-signed.tar.xz",
-            content=tarball.read_bytes(),
+            content=bootloader_tarball,
             regions=[controller],
         )
         initialize_image_storage(controller)
@@ -362,7 +387,7 @@ class TestInitialiseImageStorage:
         }
 
     def test_booloaders_export_already_exist(
-        self, controller, tmpdir, image_store_dir, factory, mocker
+        self, controller, image_store_dir, factory, mocker, bootloader_tarball
     ):
         mocker.patch("maasserver.utils.orm.post_commit_hooks")
         mocker.patch("maasserver.utils.orm.post_commit_do")
@@ -377,24 +402,15 @@ class TestInitialiseImageStorage:
             version="20230901",
             label="stable",
         )
-        tarball = Path(
-            factory.make_tarball(
-                tmpdir,
-                {
-                    "grubx64.efi": b"grub content",
-                    "bootx64.efi": b"boot content",
-                },
-            )
-        )
         rfile = make_boot_resource_file_with_content_largefile(
             factory,
             resource_set=resource_set,
             filetype=BOOT_RESOURCE_FILE_TYPE.ARCHIVE_TAR_XZ,
             filename="grub2-signed.tar.xz",
-            content=tarball.read_bytes(),
+            content=bootloader_tarball,
             regions=[controller],
         )
-        tarball.rename(rfile.local_file().path)
+        Path(rfile.local_file().path).write_bytes(bootloader_tarball)
         initialize_image_storage(controller)
         bootloader_dir = image_store_dir / "bootloaders/uefi/amd64"
         assert list_files(bootloader_dir) == {
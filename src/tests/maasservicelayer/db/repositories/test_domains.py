@@ -3,7 +3,6 @@
 
 from collections.abc import Sequence
 from datetime import datetime, timezone
-import random
 from typing import TypeVar
 
 import pytest
@@ -23,7 +22,7 @@ from tests.fixtures.factories.forwarddnsserver import (
     create_test_forwarddnsserver_entry,
 )
 from tests.fixtures.factories.staticipaddress import (
-    create_test_staticipaddress_entry,
+    create_n_test_staticipaddress_entries,
 )
 from tests.fixtures.factories.subnet import create_test_subnet_entry
 from tests.maasapiserver.fixtures.db import Fixture
@@ -121,19 +120,18 @@ class TestDomainsRepository(RepositoryCommonTests[Domain]):
         # Moved from src/maasserver/models/tests/test_staticipaddress.py
         # Reserved IPs get default hostnames when none are given.
         subnet = await create_test_subnet_entry(fixture)
-        num_ips = random.randint(3, 5)
-        ips = [
-            await create_test_staticipaddress_entry(
-                fixture,
-                subnet=subnet,
-                alloc_type=IpAddressType.USER_RESERVED.value,
-            )
-            for _ in range(num_ips)
-        ]
+        num_ips = 5
+        ips = await create_n_test_staticipaddress_entries(
+            fixture,
+            num_ips,
+            subnet=subnet,
+            alloc_type=IpAddressType.USER_RESERVED.value,
+        )
+        assert len(ips) == num_ips
         mappings = await repository_instance._get_special_mappings(
             default_ttl=30
         )
-        assert len(mappings) == len(ips)
+        assert len(mappings) == num_ips
 
     @pytest.mark.skip(reason="Not applicable")
     async def test_create_duplicated(
@@ -8,7 +8,10 @@ from maasservicelayer.builders.fabrics import FabricBuilder
 from maasservicelayer.context import Context
 from maasservicelayer.db.repositories.fabrics import FabricsRepository
 from maasservicelayer.models.fabrics import Fabric
-from tests.fixtures.factories.fabric import create_test_fabric_entry
+from tests.fixtures.factories.fabric import (
+    create_n_test_fabric_entries,
+    create_test_fabric_entry,
+)
 from tests.maasapiserver.fixtures.db import Fixture
 from tests.maasservicelayer.db.repositories.base import RepositoryCommonTests
 
@@ -24,13 +27,7 @@ class TestFabricsRepository(RepositoryCommonTests[Fabric]):
     async def _setup_test_list(
         self, fixture: Fixture, num_objects: int
     ) -> list[Fabric]:
-        created_fabrics = [
-            await create_test_fabric_entry(
-                fixture, name=str(i), description=str(i)
-            )
-            for i in range(num_objects)
-        ]
-        return created_fabrics
+        return await create_n_test_fabric_entries(fixture, num_objects)
 
     @pytest.fixture
     async def created_instance(self, fixture: Fixture) -> Fabric:
@@ -20,6 +20,7 @@ from maasservicelayer.exceptions.catalog import (
 )
 from maasservicelayer.models.resource_pools import ResourcePool
 from tests.fixtures.factories.node import (
+    create_n_test_machine_entries,
     create_test_device_entry,
     create_test_machine_entry,
     create_test_rack_controller_entry,
@@ -190,22 +191,18 @@ class TestResourcePoolRepositoryListSummary:
         )
 
         # 3 machines commissioning and 2 ready in the new resource pool
-        [
-            await create_test_machine_entry(
-                fixture,
-                pool_id=created_resource_pool.id,
-                status=NodeStatus.COMMISSIONING,
-            )
-            for _ in range(3)
-        ]
-        [
-            await create_test_machine_entry(
-                fixture,
-                pool_id=created_resource_pool.id,
-                status=NodeStatus.READY,
-            )
-            for _ in range(2)
-        ]
+        await create_n_test_machine_entries(
+            fixture,
+            3,
+            pool_id=created_resource_pool.id,
+            status=NodeStatus.COMMISSIONING,
+        )
+        await create_n_test_machine_entries(
+            fixture,
+            2,
+            pool_id=created_resource_pool.id,
+            status=NodeStatus.READY,
+        )
 
         retrieved_resource_pools = await repository_instance.list_with_summary(
             page=1, size=20, query=None
@@ -242,14 +239,12 @@ class TestResourcePoolRepositoryListSummary:
         )
 
         # 3 machines commissioning and 1 ready in the new resource pool
-        [
-            await create_test_machine_entry(
-                fixture,
-                pool_id=created_resource_pool.id,
-                status=NodeStatus.COMMISSIONING,
-            )
-            for _ in range(3)
-        ]
+        await create_n_test_machine_entries(
+            fixture,
+            3,
+            pool_id=created_resource_pool.id,
+            status=NodeStatus.COMMISSIONING,
+        )
         await create_test_machine_entry(
             fixture, pool_id=created_resource_pool.id, status=NodeStatus.READY
         )
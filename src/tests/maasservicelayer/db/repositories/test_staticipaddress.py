@@ -3,6 +3,7 @@
 
 from collections.abc import Sequence
 from ipaddress import IPv4Address
+from typing import Any
 
 import pytest
 from sqlalchemy.ext.asyncio import AsyncConnection
@@ -16,12 +17,12 @@ from maasservicelayer.db.repositories.staticipaddress import (
     StaticIPAddressClauseFactory,
     StaticIPAddressRepository,
 )
-from maasservicelayer.models.fields import MacAddress
 from maasservicelayer.models.staticipaddress import StaticIPAddress
 from tests.fixtures.factories.interface import create_test_interface_entry
 from tests.fixtures.factories.node import create_test_region_controller_entry
 from tests.fixtures.factories.node_config import create_test_node_config_entry
 from tests.fixtures.factories.staticipaddress import (
+    create_n_test_staticipaddress_entries,
     create_test_staticipaddress_entry,
 )
 from tests.fixtures.factories.subnet import create_test_subnet_entry
@@ -92,32 +93,33 @@ class TestStaticIPAddressRepository(RepositoryCommonTests[StaticIPAddress]):
     ) -> StaticIPAddressRepository:
         return StaticIPAddressRepository(Context(connection=db_connection))
 
+    @pytest.fixture
+    async def v4_subnet(self, fixture: Fixture) -> dict[str, Any]:
+        """The 10.0.0.0/24 subnet most of the tests below create IPs on."""
+        return await create_test_subnet_entry(fixture, cidr="10.0.0.0/24")
+
     @pytest.fixture
     async def _setup_test_list(
-        self, fixture: Fixture, num_objects: int
+        self, fixture: Fixture, num_objects: int, v4_subnet: dict[str, Any]
     ) -> Sequence[StaticIPAddress]:
-        subnet = await create_test_subnet_entry(fixture, cidr="10.0.0.0/24")
-        sip_sequence = [
-            StaticIPAddress(
-                **(
-                    await create_test_staticipaddress_entry(
-                        fixture,
-                        subnet=subnet,
-                        alloc_type=IpAddressType.DISCOVERED,
-                    )
-                )[0]
+        return [
+            StaticIPAddress(**row)
+            for row in await create_n_test_staticipaddress_entries(
+                fixture,
+                num_objects,
+                subnet=v4_subnet,
+                alloc_type=IpAddressType.DISCOVERED,
             )
-            for _ in range(num_objects)
         ]
-        return sip_sequence
 
     @pytest.fixture
-    async def created_instance(self, fixture: Fixture) -> StaticIPAddress:
-        subnet = await create_test_subnet_entry(fixture, cidr="10.0.0.0/24")
+    async def created_instance(
+        self, fixture: Fixture, v4_subnet: dict[str, Any]
+    ) -> StaticIPAddress:
         sip = (
             await create_test_staticipaddress_entry(
                 fixture,
-                subnet=subnet,
+                subnet=v4_subnet,
                 alloc_type=IpAddressType.DISCOVERED,
             )
         )[0]
@@ -130,24 +132,25 @@ class TestStaticIPAddressRepository(RepositoryCommonTests[StaticIPAddress]):
 
     @pytest.fixture
     async def instance_builder(
-        self, fixture: Fixture
+        self, v4_subnet: dict[str, Any]
     ) -> StaticIPAddressBuilder:
-        subnet = await create_test_subnet_entry(fixture, cidr="10.0.0.0/24")
         return StaticIPAddressBuilder(
             ip=IPv4Address("10.0.0.1"),
             alloc_type=IpAddressType.DISCOVERED,
-            subnet_id=subnet["id"],
+            subnet_id=v4_subnet["id"],
             lease_time=30,
         )
 
     async def test_create_or_update(
-        self, repository_instance: StaticIPAddressRepository, fixture: Fixture
+        self,
+        repository_instance: StaticIPAddressRepository,
+        fixture: Fixture,
+        v4_subnet: dict[str, Any],
     ) -> None:
-        subnet = await create_test_subnet_entry(fixture, cidr="10.0.0.0/24")
         sip = (
             await create_test_staticipaddress_entry(
                 fixture,
-                subnet=subnet,
+                subnet=v4_subnet,
                 alloc_type=IpAddressType.DISCOVERED,
             )
         )[0]
@@ -156,7 +159,7 @@ class TestStaticIPAddressRepository(RepositoryCommonTests[StaticIPAddress]):
 
         builder = StaticIPAddressBuilder(
             ip=sip["ip"],
-            subnet_id=subnet["id"],
+            subnet_id=v4_subnet["id"],
             alloc_type=IpAddressType(sip["alloc_type"]),
             lease_time=30,
         )
@@ -168,46 +171,27 @@ class TestStaticIPAddressRepository(RepositoryCommonTests[StaticIPAddress]):
         assert result.lease_time == 30
 
     async def test_get_discovered_ips_in_family_for_interfaces(
-        self, repository_instance: StaticIPAddressRepository, fixture: Fixture
+        self,
+        repository_instance: StaticIPAddressRepository,
+        fixture: Fixture,
+        v4_subnet: dict[str, Any],
     ) -> None:
-        v4_subnet = await create_test_subnet_entry(fixture, cidr="10.0.0.0/24")
         v6_subnet = await create_test_subnet_entry(
             fixture, cidr="fd42:be3f:b08a:3d6c::/64"
         )
-        v4_discovered_addrs = [
-            (
-                await create_test_staticipaddress_entry(
-                    fixture,
-                    subnet=v4_subnet,
-                    alloc_type=IpAddressType.DISCOVERED,
-                )
-            )[0]
-            for _ in range(3)
-        ]
-        v4_other_addrs = [
-            (
-                await create_test_staticipaddress_entry(
-                    fixture,
-                    subnet=v4_subnet,
-                    alloc_type=IpAddressType.AUTO,
-                )
-            )[0]
-            for _ in range(3)
-        ]
-        v6_addrs = [
-            (
-                await create_test_staticipaddress_entry(
-                    fixture,
-                    subnet=v6_subnet,
-                    alloc_type=IpAddressType.DISCOVERED,
-                )
-            )[0]
-            for _ in range(3)
-        ]
+        v4_discovered_addrs = await create_n_test_staticipaddress_entries(
+            fixture, 3, subnet=v4_subnet, alloc_type=IpAddressType.DISCOVERED
+        )
+        v4_other_addrs = await create_n_test_staticipaddress_entries(
+            fixture, 3, subnet=v4_subnet, alloc_type=IpAddressType.AUTO
+        )
+        v6_addrs = await create_n_test_staticipaddress_entries(
+            fixture, 3, subnet=v6_subnet, alloc_type=IpAddressType.DISCOVERED
+        )
+        v4_discovered_ids = {addr["id"] for addr in v4_discovered_addrs}
+        all_addrs = v4_discovered_addrs + v4_other_addrs + v6_addrs
         interfaces = [
-            await create_test_interface_entry(
-                fixture, ips=v4_discovered_addrs + v4_other_addrs + v6_addrs
-            )
+            await create_test_interface_entry(fixture, ips=all_addrs)
             for _ in range(3)
         ]
 
@@ -215,9 +199,7 @@ class TestStaticIPAddressRepository(RepositoryCommonTests[StaticIPAddress]):
             interfaces, family=IpAddressFamily.IPV4
         )
 
-        assert {addr.id for addr in result} == {
-            addr["id"] for addr in v4_discovered_addrs
-        }
+        assert {addr.id for addr in result} == v4_discovered_ids
 
     async def test_get_for_nodes_not_found(
         self, repository_instance: StaticIPAddressRepository, fixture: Fixture
@@ -273,9 +255,11 @@ class TestStaticIPAddressRepository(RepositoryCommonTests[StaticIPAddress]):
         assert any(ip2["ip"] == ip.ip for ip in result)
 
     async def test_get_mac_addresses(
-        self, repository_instance: StaticIPAddressRepository, fixture: Fixture
+        self,
+        repository_instance: StaticIPAddressRepository,
+        fixture: Fixture,
+        v4_subnet: dict[str, Any],
     ):
-        v4_subnet = await create_test_subnet_entry(fixture, cidr="10.0.0.0/24")
         ip = (
             await create_test_staticipaddress_entry(
                 fixture,
@@ -291,19 +275,20 @@ class TestStaticIPAddressRepository(RepositoryCommonTests[StaticIPAddress]):
         result = await repository_instance.get_mac_addresses(
             query=QuerySpec(where=StaticIPAddressClauseFactory.with_ip(ipv4))
         )
-        expected_mac_addresses = sorted(
-            [MacAddress(i.mac_address) for i in interfaces]
-        )
-        assert sorted(result) == expected_mac_addresses
+        # MacAddress is a str subclass, so compare against the stored
+        # strings instead of re-validating each address.
+        assert sorted(result) == sorted(i.mac_address for i in interfaces)
 
     async def test_get_with_interface_ids(
-        self, repository_instance: StaticIPAddressRepository, fixture: Fixture
+        self,
+        repository_instance: StaticIPAddressRepository,
+        fixture: Fixture,
+        v4_subnet: dict[str, Any],
     ):
-        subnet = await create_test_subnet_entry(fixture, cidr="10.0.0.0/24")
         ip = (
             await create_test_staticipaddress_entry(
                 fixture,
-                subnet=subnet,
+                subnet=v4_subnet,
                 alloc_type=IpAddressType.DISCOVERED,
             )
         )[0]
@@ -312,7 +297,7 @@ class TestStaticIPAddressRepository(RepositoryCommonTests[StaticIPAddress]):
         ip2 = (
             await create_test_staticipaddress_entry(
                 fixture,
-                subnet=subnet,
+                subnet=v4_subnet,
                 alloc_type=IpAddressType.DISCOVERED,
             )
         )[0]
@@ -332,13 +317,15 @@ class TestStaticIPAddressRepository(RepositoryCommonTests[StaticIPAddress]):
         assert ip2["ip"] in ips
 
     async def test_unlink_from_interfaces(
-        self, repository_instance: StaticIPAddressRepository, fixture: Fixture
+        self,
+        repository_instance: StaticIPAddressRepository,
+        fixture: Fixture,
+        v4_subnet: dict[str, Any],
     ):
-        subnet = await create_test_subnet_entry(fixture, cidr="10.0.0.0/24")
         ip = (
             await create_test_staticipaddress_entry(
                 fixture,
-                subnet=subnet,
+                subnet=v4_subnet,
                 alloc_type=IpAddressType.DISCOVERED,
             )
         )[0]
@@ -23,7 +23,10 @@ from tests.fixtures.factories.node import (
     create_test_machine_entry,
     create_test_rack_controller_entry,
 )
-from tests.fixtures.factories.zone import create_test_zone
+from tests.fixtures.factories.zone import (
+    create_test_zone,
+    create_test_zones_bulk,
+)
 from tests.maasapiserver.fixtures.db import Fixture
 from tests.maasservicelayer.db.repositories.base import RepositoryCommonTests
 
@@ -71,14 +74,13 @@ class TestZonesRepository(RepositoryCommonTests[Zone]):
             )
         ]
         created_zones.extend(
-            [
-                (
-                    await create_test_zone(
-                        fixture, name=str(i), description=str(i)
-                    )
-                )
-                for i in range(0, num_objects - 1)
-            ]
+            await create_test_zones_bulk(
+                fixture,
+                [
+                    {"name": str(i), "description": str(i)}
+                    for i in range(0, num_objects - 1)
+                ],
+            )
         )
         return created_zones
 
@@ -143,10 +145,9 @@ class TestZonesRepository(RepositoryCommonTests[Zone]):
         self, repository_instance: ZonesRepository, fixture: Fixture
     ) -> None:
         zone_names = [str(x) for x in range(4)]
-        [
-            await create_test_zone(fixture=fixture, name=name)
-            for name in zone_names
-        ]
+        await create_test_zones_bulk(
+            fixture, [{"name": name} for name in zone_names]
+        )
 
         all_zones = []
         zones = await repository_instance.list_with_summary(1, 2)
@@ -3,7 +3,7 @@
 
 from maastesting.pytest.database import ensuremaasdb, templatemaasdb
 
-from ..fixtures import services_mock
+from ..fixtures import services_holder, services_mock
 from ..maasapiserver.fixtures.db import db, db_connection, fixture, test_config
 from .workflow import temporal_calls, worker_test_interceptor
 
@@ -12,6 +12,7 @@ __all__ = [
     "db_connection",
     "ensuremaasdb",
     "fixture",
+    "services_holder",
     "services_mock",
     "templatemaasdb",
     "test_config",